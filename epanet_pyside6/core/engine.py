@@ -1,6 +1,7 @@
 """EPANET Engine wrapper using WNTR."""
 
 import wntr
+import numpy as np
 import pandas as pd
 import os
 import tempfile
@@ -222,6 +223,34 @@ class Engine:
             pass
         return {}
 
+    def get_final_values(self, attr: str, ids, kind: str = 'node') -> np.ndarray:
+        """Get the last reported value of a result, aligned to ids (0.0 where missing)."""
+        if not self.results:
+            return np.zeros(len(ids))
+            
+        try:
+            results = self.results.node if kind == 'node' else self.results.link
+            final = results[attr].iloc[-1]
+        except (KeyError, IndexError):
+            return np.zeros(len(ids))
+        return final.reindex(ids, fill_value=0.0).to_numpy(dtype=np.float64)
+
+    def get_results_view(self, attr: str, kind: str = 'node') -> Optional[memoryview]:
+        """Get a zero-copy view of a full results table (time x objects).
+        
+        The view shares memory with the WNTR results DataFrame, so large
+        simulations can be summarized without copying the whole table.
+        """
+        if not self.results:
+            return None
+            
+        try:
+            results = self.results.node if kind == 'node' else self.results.link
+            arr = results[attr].to_numpy(copy=False)
+            return memoryview(arr)
+        except (KeyError, ValueError, TypeError):
+            return None
+
     def get_pump_energy(self, pump_id: str) -> float:
         """Get pump energy usage (kWh)."""
         if not self.results:
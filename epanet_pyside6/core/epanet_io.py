@@ -4,6 +4,9 @@ import os
 from datetime import datetime
 from core.constants import NodeParam, LinkParam
 
+# HeadLossType value -> INP keyword
+_HEADLOSS_NAMES = {0: "H-W", 1: "D-W", 2: "C-M"}
+
 def export_scenario(project, filepath: str):
     """Export scenario data to INP file.
     
@@ -104,8 +107,7 @@ def export_scenario(project, filepath: str):
         f.write(f" Units              \t{opts.flow_units.name}\n")
         
         # Headloss
-        hl_map = {0: "H-W", 1: "D-W", 2: "C-M"}
-        hl_str = hl_map.get(int(opts.headloss_formula), "H-W")
+        hl_str = _HEADLOSS_NAMES.get(int(opts.headloss_formula), "H-W")
         f.write(f" Headloss           \t{hl_str}\n")
         
         f.write(f" Specific Gravity   \t{opts.specific_gravity}\n")
@@ -195,7 +197,7 @@ def import_scenario(project, filepath: str):
                     if node_id in network.nodes:
                         node = network.nodes[node_id]
                         if len(tokens) >= 2:
-                            node.initial_quality = float(tokens[1])
+                            node.init_quality = float(tokens[1])
                             
                 elif current_section == "STATUS":
                     # Format: ID Status/Setting
@@ -345,8 +347,8 @@ def export_network(project, filepath: str):
             wntr.network.write_inpfile(wn, filepath)
             
             # Append Controls and Rules manually
-            # WNTR might not write them if they are not in the WNTR model
-            # So we append them from our internal model
+            # Simple controls synced into the WNTR model are already written by WNTR;
+            # anything else is appended from our internal model
             
             # Read the file back to insert before [END]
             with open(filepath, 'r', encoding='utf-8') as f:
@@ -360,9 +362,11 @@ def export_network(project, filepath: str):
             controls_text = ""
             
             # Controls
-            if project.network.controls:
+            synced = getattr(project, '_synced_controls', set())
+            controls = [c for c in project.network.controls if c.to_string() not in synced]
+            if controls:
                 controls_text += "\n[CONTROLS]\n"
-                for control in project.network.controls:
+                for control in controls:
                     controls_text += f"{control.to_string()}\n"
                 controls_text += "\n"
             
@@ -1,12 +1,25 @@
 """Network data container."""
 
 from typing import Dict, List, Optional
+import numpy as np
 from models import Node, Junction, Reservoir, Tank
 from models import Link, Pipe, Pump, Valve
 from models import Pattern, Curve, Options
 from models.control import SimpleControl, Rule
 
 
+# Node/link class -> name of its per-type dict; subclasses are added on
+# first sight by Network._type_index
+_TYPE_INDEX_ATTR = {
+    Junction: 'junctions',
+    Reservoir: 'reservoirs',
+    Tank: 'tanks',
+    Pipe: 'pipes',
+    Pump: 'pumps',
+    Valve: 'valves'
+}
+
+
 class Network:
     """Container for all network data."""
     
@@ -21,6 +34,14 @@ class Network:
         self.labels: Dict[str, Any] = {} # Dict[str, Label]
         self.options: Options = Options()
         
+        # Per-type views of nodes/links, kept in step by the add/remove methods
+        self.junctions: Dict[str, Junction] = {}
+        self.reservoirs: Dict[str, Reservoir] = {}
+        self.tanks: Dict[str, Tank] = {}
+        self.pipes: Dict[str, Pipe] = {}
+        self.pumps: Dict[str, Pump] = {}
+        self.valves: Dict[str, Valve] = {}
+        
         # Project metadata
         self.title: List[str] = ["", "", ""]
         self.notes: str = ""
@@ -42,6 +63,9 @@ class Network:
         """Clear all network data."""
         self.nodes.clear()
         self.links.clear()
+        for index in (self.junctions, self.reservoirs, self.tanks,
+                      self.pipes, self.pumps, self.valves):
+            index.clear()
         self.patterns.clear()
         self.curves.clear()
         self.controls.clear()
@@ -58,6 +82,32 @@ class Network:
             'max_y': 10000.0
         }
     
+    def _type_index(self, obj) -> Optional[Dict]:
+        """Per-type dict that holds obj (None for unknown node/link classes)."""
+        cls = type(obj)
+        if cls in _TYPE_INDEX_ATTR:
+            attr = _TYPE_INDEX_ATTR[cls]
+        else:
+            attr = None
+            for base in cls.__mro__[1:]:
+                attr = _TYPE_INDEX_ATTR.get(base)
+                if attr is not None:
+                    break
+            _TYPE_INDEX_ATTR[cls] = attr
+        return getattr(self, attr) if attr is not None else None
+    
+    def _index_add(self, obj):
+        """Record a node/link in its per-type dict."""
+        index = self._type_index(obj)
+        if index is not None:
+            index[obj.id] = obj
+    
+    def _index_remove(self, obj):
+        """Drop a node/link from its per-type dict."""
+        index = self._type_index(obj)
+        if index is not None:
+            index.pop(obj.id, None)
+    
     # Node operations
     
     def add_node(self, node: Node):
@@ -65,8 +115,31 @@ class Network:
         if node.id in self.nodes:
             raise ValueError(f"Node {node.id} already exists")
         self.nodes[node.id] = node
+        self._index_add(node)
         self._update_map_bounds(node.x, node.y)
     
+    def add_nodes_bulk(self, nodes: List[Node]):
+        """Add many nodes at once (e.g. when loading a file).
+        
+        All IDs are checked before anything is added, and the map bounds are
+        updated once for the whole batch.
+        """
+        new_nodes = {}
+        for node in nodes:
+            if node.id in self.nodes or node.id in new_nodes:
+                raise ValueError(f"Node {node.id} already exists")
+            new_nodes[node.id] = node
+        if not new_nodes:
+            return
+        
+        self.nodes.update(new_nodes)
+        for node in new_nodes.values():
+            self._index_add(node)
+        xs = [node.x for node in new_nodes.values()]
+        ys = [node.y for node in new_nodes.values()]
+        self._update_map_bounds(min(xs), min(ys))
+        self._update_map_bounds(max(xs), max(ys))
+    
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get node by ID."""
         return self.nodes.get(node_id)
@@ -83,19 +156,25 @@ class Network:
                     f"Cannot delete node {node_id}: "
                     f"it is connected to link {link.id}"
                 )
-        del self.nodes[node_id]
+        self._index_remove(self.nodes.pop(node_id))
+    
+    def node_column(self, attr: str, nodes: Optional[List[Node]] = None) -> np.ndarray:
+        """Gather one numeric node attribute into a float array (NaN where missing)."""
+        if nodes is None:
+            nodes = self.nodes.values()
+        return np.array([getattr(node, attr, None) for node in nodes], dtype=float)
     
     def get_junctions(self) -> List[Junction]:
         """Get all junctions."""
-        return [n for n in self.nodes.values() if isinstance(n, Junction)]
+        return list(self.junctions.values())
     
     def get_reservoirs(self) -> List[Reservoir]:
         """Get all reservoirs."""
-        return [n for n in self.nodes.values() if isinstance(n, Reservoir)]
+        return list(self.reservoirs.values())
     
     def get_tanks(self) -> List[Tank]:
         """Get all tanks."""
-        return [n for n in self.nodes.values() if isinstance(n, Tank)]
+        return list(self.tanks.values())
     
     # Link operations
     
@@ -111,27 +190,57 @@ class Network:
             raise ValueError(f"To node {link.to_node} does not exist")
         
         self.links[link.id] = link
+        self._index_add(link)
+    
+    def add_links_bulk(self, links: List[Link]):
+        """Add many links at once; all are validated before any is added."""
+        new_links = {}
+        nodes = self.nodes
+        for link in links:
+            if link.id in self.links or link.id in new_links:
+                raise ValueError(f"Link {link.id} already exists")
+            if link.from_node not in nodes:
+                raise ValueError(f"From node {link.from_node} does not exist")
+            if link.to_node not in nodes:
+                raise ValueError(f"To node {link.to_node} does not exist")
+            new_links[link.id] = link
+        self.links.update(new_links)
+        for link in new_links.values():
+            self._index_add(link)
     
     def get_link(self, link_id: str) -> Optional[Link]:
         """Get link by ID."""
         return self.links.get(link_id)
     
-    def remove_link(self, link_id: str):
-        """Remove link from network."""
-        if link_id in self.links:
-            del self.links[link_id]
+    def remove_link(self, link_id: str) -> bool:
+        """Remove link from network. Returns False if it did not exist."""
+        link = self.links.pop(link_id, None)
+        if link is None:
+            return False
+        self._index_remove(link)
+        return True
+    
+    def link_column(self, attr: str, links: Optional[List[Link]] = None) -> np.ndarray:
+        """Gather one numeric link attribute into a float array.
+        
+        Links lacking the attribute (or holding None) give NaN. Pass links to
+        keep the array aligned with an existing ordering.
+        """
+        if links is None:
+            links = self.links.values()
+        return np.array([getattr(link, attr, None) for link in links], dtype=float)
     
     def get_pipes(self) -> List[Pipe]:
         """Get all pipes."""
-        return [l for l in self.links.values() if isinstance(l, Pipe)]
+        return list(self.pipes.values())
     
     def get_pumps(self) -> List[Pump]:
         """Get all pumps."""
-        return [l for l in self.links.values() if isinstance(l, Pump)]
+        return list(self.pumps.values())
     
     def get_valves(self) -> List[Valve]:
         """Get all valves."""
-        return [l for l in self.links.values() if isinstance(l, Valve)]
+        return list(self.valves.values())
     
     # Pattern operations
     
@@ -193,10 +302,9 @@ class Network:
         """Get label by ID."""
         return self.labels.get(label_id)
         
-    def remove_label(self, label_id: str):
-        """Remove label from network."""
-        if label_id in self.labels:
-            del self.labels[label_id]
+    def remove_label(self, label_id: str) -> bool:
+        """Remove label from network. Returns False if it did not exist."""
+        return self.labels.pop(label_id, None) is not None
     
     # Utility methods
     
@@ -1,12 +1,643 @@
 """EPANET Project management."""
 
 from typing import Optional, Callable, Any, Tuple, Dict
+from operator import attrgetter
+from datetime import datetime
+from enum import Enum
+from math import hypot, isnan
+from sys import intern
+import mmap
+import re
+import numpy as np
 import wntr
 from .engine import Engine
 from .network import Network
+from .units import UnitSystem, get_converter, get_unit_label
 from .constants import *
-from models import Junction, Reservoir, Tank, Pipe, Pump, Valve
-from models.control import SimpleControl, Rule
+from models import Junction, Reservoir, Tank, Pipe, Pump, Valve, Pattern, Curve, CurveType, Label
+from models.control import SimpleControl
+
+
+_REPORT_HEADER = (
+    "EPANET 2.2 - PySide6 Simulation Report\n"
+    "======================================\n"
+    "Date: {date:%Y-%m-%d %H:%M:%S}\n"
+    "Project: {project}\n"
+    "\n"
+)
+
+_REPORT_SUCCESS = _REPORT_HEADER + (
+    "Simulation Status: SUCCESSFUL\n"
+    "\n"
+    "Network Statistics:\n"
+    "  Nodes: {n_nodes}\n"
+    "  Links: {n_links}"
+)
+
+_REPORT_DETAILS = (
+    "\n"
+    "\n"
+    "Simulation Details:\n"
+    "  Duration: {duration:.2f} hours\n"
+    "  Time Steps: {steps}"
+)
+
+_REPORT_PRESSURE = (
+    "\n"
+    "  Pressure Range: {low:.2f} to {high:.2f} {units}"
+)
+
+_REPORT_FAILED = _REPORT_HEADER + (
+    "Simulation Status: FAILED\n"
+    "Error: {error}"
+)
+
+
+# MixingModel -> WNTR mixing model name
+_MIXING_NAME = {
+    MixingModel.MIX1: 'MIXED',
+    MixingModel.MIX2: '2COMP',
+    MixingModel.FIFO: 'FIFO',
+    MixingModel.LIFO: 'LIFO'
+}
+
+# LinkStatus -> WNTR initial status name
+_STATUS_NAME = {
+    LinkStatus.OPEN: 'OPEN',
+    LinkStatus.CLOSED: 'CLOSED',
+    LinkStatus.CV: 'CV'
+}
+
+# HeadLossType / QualityType -> WNTR option value
+_HEADLOSS_NAME = {
+    HeadLossType.HW: 'H-W',
+    HeadLossType.DW: 'D-W',
+    HeadLossType.CM: 'C-M'
+}
+
+_QUALITY_NAME = {
+    QualityType.NONE: 'NONE',
+    QualityType.CHEM: 'CHEMICAL',
+    QualityType.AGE: 'AGE',
+    QualityType.TRACE: 'TRACE'
+}
+
+_CURVE_TYPE_NAME = {ct: ct.name for ct in CurveType}
+
+# WNTR / INP names -> project enums
+_FLOW_UNITS_MAP = {fu.name: fu for fu in FlowUnits}
+
+# Keys have '-' stripped, so 'H-W' and 'HW' both resolve
+_HEADLOSS_MAP = {
+    'HW': HeadLossType.HW,
+    'DW': HeadLossType.DW,
+    'CM': HeadLossType.CM
+}
+
+_QUALITY_MAP = {
+    'NONE': QualityType.NONE,
+    'CHEMICAL': QualityType.CHEM,
+    'CHEM': QualityType.CHEM,
+    'AGE': QualityType.AGE,
+    'TRACE': QualityType.TRACE
+}
+
+_MIXING_MODEL_MAP = {name: model for model, name in _MIXING_NAME.items()}
+# WNTR MixType member names
+_MIXING_MODEL_MAP.update(MIX1=MixingModel.MIX1, MIX2=MixingModel.MIX2, TWOCOMP=MixingModel.MIX2)
+
+_VALVE_TYPE_MAP = {
+    'PRV': LinkType.PRV,
+    'PSV': LinkType.PSV,
+    'PBV': LinkType.PBV,
+    'FCV': LinkType.FCV,
+    'TCV': LinkType.TCV,
+    'GPV': LinkType.GPV
+}
+
+_STATUS_MAP = {
+    'OPEN': LinkStatus.OPEN,
+    'CLOSED': LinkStatus.CLOSED,
+    'CV': LinkStatus.CV
+}
+
+_CURVE_TYPE_MAP = {
+    'VOLUME': CurveType.VOLUME,
+    'PUMP': CurveType.PUMP,
+    'EFFICIENCY': CurveType.EFFICIENCY,
+    'HEADLOSS': CurveType.HEADLOSS
+}
+
+_VALVE_TYPES = frozenset({
+    LinkType.PRV, LinkType.PSV, LinkType.PBV,
+    LinkType.FCV, LinkType.TCV, LinkType.GPV
+})
+
+# Valves whose setting is a pressure
+_PRESSURE_VALVE_TYPES = frozenset({LinkType.PRV, LinkType.PSV, LinkType.PBV})
+
+# Link type -> prefix for generated IDs
+_LINK_ID_PREFIXES = {
+    'Pipe': 'P',
+    'Pump': 'P', # Or PU?
+    'Valve': 'V'
+}
+
+# Marks an attribute missing from a WNTR object (cheaper than hasattr + getattr)
+_MISSING = object()
+
+
+_MAP_COORD_DTYPE = [('id', 'U64'), ('x', 'f8'), ('y', 'f8')]
+
+
+_SECTION_RE = re.compile(rb'^[ \t]*\[', re.MULTILINE)
+_COORDINATES_RE = re.compile(rb'^[ \t]*\[COORDINATES\][^\n]*', re.MULTILINE | re.IGNORECASE)
+
+
+def _read_map_coordinate_text(filename: str) -> str:
+    """Return the [COORDINATES] text of an INP file, or all of a pure map file.
+    
+    The file is memory-mapped and only the matching byte ranges are decoded.
+    """
+    with open(filename, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return ""
+        try:
+            if not _SECTION_RE.search(data):
+                return data[:].decode('utf-8', 'replace')
+            
+            chunks = []
+            for header in _COORDINATES_RE.finditer(data):
+                end = _SECTION_RE.search(data, header.end())
+                chunks.append(data[header.end():end.start() if end else len(data)])
+            return b'\n'.join(chunks).decode('utf-8', 'replace')
+        finally:
+            data.close()
+
+
+def _parse_map_coords(lines) -> Dict[str, Tuple[float, float]]:
+    """Parse 'ID X Y' lines into a coordinate dict, skipping blanks and ';' comments."""
+    if not lines:
+        return {}
+    try:
+        # One C-level parse for well-formed sections
+        arr = np.loadtxt(lines, dtype=_MAP_COORD_DTYPE, comments=';',
+                         usecols=(0, 1, 2), ndmin=1)
+        return dict(zip(arr['id'].tolist(),
+                        zip(arr['x'].tolist(), arr['y'].tolist())))
+    except (ValueError, IndexError):
+        pass
+    
+    # Malformed lines: parse one at a time and skip the bad ones
+    coords = {}
+    for line in lines:
+        parts = line.split()
+        if len(parts) >= 3 and not parts[0].startswith(';'):
+            try:
+                coords[parts[0]] = (float(parts[1]), float(parts[2]))
+            except ValueError:
+                continue
+    return coords
+
+
+def _upper_str(value) -> str:
+    return str(value).upper()
+
+
+# Raw name -> upper-case key; WNTR hands back the same few enum names and
+# type strings for every element, so each key is only built once
+_WNTR_KEYS: Dict[str, str] = {}
+
+
+def _wntr_key(value) -> str:
+    """Upper-case lookup key for a WNTR enum member or plain string."""
+    # Enum members already carry their name; str() would go through __str__.
+    # Cached by that name since some WNTR enums (LinkStatus) are unhashable.
+    name = value.name if isinstance(value, Enum) else str(value)
+    key = _WNTR_KEYS.get(name)
+    if key is None:
+        key = _WNTR_KEYS[name] = name.upper()
+    return key
+
+
+# (WNTR options section, [(WNTR attribute, Options field, cast or None)])
+_OPTION_LOAD_FIELDS = (
+    ('hydraulic', (
+        ('viscosity', 'viscosity', None),
+        ('specific_gravity', 'specific_gravity', None),
+        ('trials', 'trials', None),
+        ('accuracy', 'accuracy', None),
+        ('unbalanced', 'unbalanced', _upper_str),
+        ('demand_multiplier', 'demand_multiplier', None),
+        ('emitter_exponent', 'emitter_exponent', None),
+    )),
+    ('quality', (
+        ('diffusivity', 'diffusivity', None),
+        ('tolerance', 'quality_tolerance', None),
+    )),
+    ('reaction', (
+        ('bulk_order', 'bulk_order', None),
+        ('wall_order', 'wall_order', None),
+        ('bulk_coeff', 'global_bulk_coeff', None),
+        ('wall_coeff', 'global_wall_coeff', None),
+        ('limiting_potential', 'limiting_concentration', None),
+        ('roughness_correlation', 'roughness_correlation', None),
+    )),
+    ('time', (
+        ('duration', 'duration', int),
+        ('hydraulic_timestep', 'hydraulic_timestep', int),
+        ('quality_timestep', 'quality_timestep', int),
+        ('pattern_timestep', 'pattern_timestep', int),
+        ('pattern_start', 'pattern_start', int),
+        ('report_timestep', 'report_timestep', int),
+        ('report_start', 'report_start', int),
+        ('statistic', 'statistic', _upper_str),
+    )),
+    ('energy', (
+        ('global_efficiency', 'global_efficiency', None),
+        ('global_price', 'global_price', None),
+        ('demand_charge', 'demand_charge', None),
+    )),
+)
+
+# (WNTR options section, ((WNTR attribute, NetworkOptions field), ...)) written
+# by _sync_options; fields that are None or missing on the WNTR side are skipped
+_OPTION_SYNC_FIELDS = (
+    ('hydraulic', (
+        ('viscosity', 'viscosity'),
+        ('specific_gravity', 'specific_gravity'),
+        ('trials', 'trials'),
+        ('accuracy', 'accuracy'),
+        ('demand_multiplier', 'demand_multiplier'),
+        ('emitter_exponent', 'emitter_exponent'),
+    )),
+    ('quality', (
+        ('diffusivity', 'diffusivity'),
+        ('tolerance', 'quality_tolerance'),
+    )),
+    ('reaction', (
+        ('bulk_order', 'bulk_order'),
+        ('wall_order', 'wall_order'),
+        ('bulk_coeff', 'global_bulk_coeff'),
+        ('wall_coeff', 'global_wall_coeff'),
+        ('limiting_potential', 'limiting_concentration'),
+        ('roughness_correlation', 'roughness_correlation'),
+    )),
+    ('time', (
+        ('duration', 'duration'),
+        ('hydraulic_timestep', 'hydraulic_timestep'),
+        ('quality_timestep', 'quality_timestep'),
+        ('pattern_timestep', 'pattern_timestep'),
+        ('pattern_start', 'pattern_start'),
+        ('report_timestep', 'report_timestep'),
+        ('report_start', 'report_start'),
+    )),
+    ('energy', (
+        ('global_efficiency', 'global_efficiency'),
+        ('global_price', 'global_price'),
+        ('demand_charge', 'demand_charge'),
+    )),
+)
+
+# Snapshot of every Options field _sync_options writes
+_OPTION_STATE = attrgetter(
+    'flow_units', 'headloss_formula', 'quality_type',
+    *(field for _, fields in _OPTION_SYNC_FIELDS for _, field in fields)
+)
+
+
+# (WNTR attribute, project attribute) pairs probed once per class pair by
+# _sync_capabilities; None means only the WNTR side needs the attribute
+_NODE_SYNC_ATTRS = (
+    ('elevation', 'elevation'), ('tag', None),
+    ('base_demand', 'base_demand'), ('demand_timeseries_list', None),
+    ('demand_pattern_name', 'demand_pattern'), ('emitter_coefficient', 'emitter_coeff'),
+    ('base_head', 'total_head'), ('head_pattern_name', 'head_pattern'),
+    ('init_level', 'init_level'), ('min_level', 'min_level'), ('max_level', 'max_level'),
+    ('diameter', 'diameter'), ('min_volume', 'min_volume'),
+    ('vol_curve_name', 'volume_curve'), ('mixing_model', 'mixing_model'),
+    ('mixing_fraction', 'mixing_fraction'), ('bulk_reaction_coefficient', 'bulk_coeff'),
+)
+_LINK_SYNC_ATTRS = (
+    ('tag', None), ('status', None), ('initial_status', None),
+    ('length', None), ('diameter', None),
+    ('roughness', 'roughness'), ('minor_loss', 'minor_loss'),
+    ('bulk_reaction_coefficient', 'bulk_coeff'), ('wall_reaction_coefficient', 'wall_coeff'),
+    ('pump_curve_name', 'pump_curve'), ('power', 'power'),
+    ('speed_pattern_name', 'speed_pattern'), ('setting', 'valve_setting'),
+)
+
+
+def _sync_capabilities(cache: Dict, wn_obj, obj, attrs) -> frozenset:
+    """Names of the WNTR attributes in attrs that both wn_obj and obj support.
+    
+    Probed with hasattr on the first pair of each (WNTR class, model class)
+    and cached, so the sync loops test set membership instead.
+    """
+    key = (type(wn_obj), type(obj))
+    caps = cache.get(key)
+    if caps is None:
+        caps = frozenset(
+            wn_attr for wn_attr, attr in attrs
+            if hasattr(wn_obj, wn_attr) and (attr is None or hasattr(obj, attr))
+        )
+        cache[key] = caps
+    return caps
+
+
+# Project attributes that feed the WNTR model; an element whose values are
+# unchanged since the last sync is skipped (see _sync_state)
+_NODE_STATE_FIELDS = (
+    'x', 'y', 'tag', 'elevation', 'base_demand', 'demand_pattern', 'emitter_coeff',
+    'total_head', 'head_pattern', 'init_level', 'min_level', 'max_level',
+    'diameter', 'min_volume', 'volume_curve', 'mixing_model', 'mixing_fraction',
+    'bulk_coeff',
+)
+_LINK_STATE_FIELDS = (
+    'tag', 'status', 'length', 'diameter', 'roughness', 'minor_loss',
+    'bulk_coeff', 'wall_coeff', 'pump_curve', 'power', 'speed_pattern',
+    'valve_setting',
+)
+
+# Model class -> attrgetter over the state fields that class has
+_STATE_GETTERS = {}
+
+
+def _sync_state(obj, fields) -> tuple:
+    """Snapshot of the synced attributes of a node or link, tagged with its class."""
+    cls = type(obj)
+    getter = _STATE_GETTERS.get(cls)
+    if getter is None:
+        names = [name for name in fields if hasattr(obj, name)]
+        getter = attrgetter('id', *names)
+        _STATE_GETTERS[cls] = getter
+    return (cls, getter(obj))
+
+
+def _unsynced(objs: Dict, synced: Dict, changed: Dict, fields) -> list:
+    """Objects in objs whose snapshot differs from synced; new snapshots go to changed."""
+    result = []
+    for obj in objs.values():
+        state = _sync_state(obj, fields)
+        if synced.get(obj.id) != state:
+            changed[obj.id] = state
+            result.append(obj)
+    return result
+
+
+def _sync_link_common(wn_link, link, caps) -> None:
+    """Copy the tag and initial status shared by every link type to WNTR."""
+    if 'tag' in caps:
+        wn_link.tag = link.tag
+    if 'status' in caps:
+        new_status = _STATUS_NAME.get(link.status, 'OPEN')
+        
+        # WNTR Pipe status is read-only property that reflects current simulation state
+        # To set initial status, use initial_status
+        if 'initial_status' in caps:
+            wn_link.initial_status = new_status
+        else:
+            # Try setting status directly if it's not read-only (e.g. for Pumps/Valves it might be settable)
+            try:
+                wn_link.status = new_status
+            except AttributeError:
+                pass
+
+
+def _curve_factors(converter, to_si: bool) -> Dict:
+    """(x, y) scale factors per curve type for a single unit conversion direction."""
+    if to_si:
+        len_f = converter.length_to_si(1.0)
+        flow_f = converter.flow_to_si(1.0)
+        vol_f = 1.0 / 35.3147 if converter.system == UnitSystem.US else 1.0
+    else:
+        len_f = converter.length_to_project(1.0)
+        flow_f = converter.flow_to_project(1.0)
+        vol_f = 35.3147 if converter.system == UnitSystem.US else 1.0
+    return {
+        CurveType.VOLUME: (len_f, vol_f),
+        CurveType.PUMP: (flow_f, len_f), # Head
+        CurveType.EFFICIENCY: (flow_f, 1.0), # Y is efficiency %
+        CurveType.HEADLOSS: (flow_f, len_f), # Headloss
+    }
+
+
+def _scale_curve_points(points, factors) -> list:
+    """Scale (x, y) curve points by an (fx, fy) pair in one vectorized op."""
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if factors is not None:
+        pts = pts * factors
+    return list(map(tuple, pts.tolist()))
+
+
+# Fields every WNTR object of the type has, read in one call each; optional
+# fields still go through getattr(..., _MISSING)
+_LINK_ENDS_GET = attrgetter('start_node_name', 'end_node_name')
+_TANK_GET = attrgetter('init_level', 'min_level', 'max_level', 'min_vol', 'diameter')
+
+
+def _link_ends(link) -> Tuple[str, str]:
+    """Start/end node names of a WNTR link, interned.
+    
+    Node IDs are interned as they are loaded, so every link end shares the
+    node's ID string instead of holding its own copy.
+    """
+    from_node, to_node = _LINK_ENDS_GET(link)
+    return intern(from_node), intern(to_node)
+
+
+def _build_pipe(name: str, link, converter, length: float, diameter: float) -> Pipe:
+    """Build a Pipe from a WNTR pipe (length/diameter already in project units)."""
+    from_node, to_node = _link_ends(link)
+    
+    new_link = Pipe(
+        id=name,
+        from_node=from_node,
+        to_node=to_node,
+        length=length,
+        diameter=diameter,
+        roughness=link.roughness
+    )
+    value = getattr(link, 'minor_loss', _MISSING)
+    if value is not _MISSING:
+        new_link.minor_loss = value
+    value = getattr(link, 'bulk_reaction_coefficient', _MISSING)
+    if value is not _MISSING:
+        new_link.bulk_coeff = value
+    value = getattr(link, 'wall_reaction_coefficient', _MISSING)
+    if value is not _MISSING:
+        new_link.wall_coeff = value
+    return new_link
+
+
+def _build_pump(name: str, link, converter, length: float, diameter: float) -> Pump:
+    """Build a Pump from a WNTR pump."""
+    from_node, to_node = _link_ends(link)
+    
+    new_link = Pump(
+        id=name,
+        from_node=from_node,
+        to_node=to_node
+    )
+    value = getattr(link, 'pump_curve_name', _MISSING)
+    if value is not _MISSING:
+        new_link.pump_curve = value
+    power = getattr(link, 'power', _MISSING)
+    if power is not _MISSING:
+        # Power units? HP (US) or kW (SI)
+        if converter.system == UnitSystem.US:
+            power = power / 745.7
+        else:
+            power = power / 1000.0
+        new_link.power = power
+
+    value = getattr(link, 'speed_pattern_name', _MISSING)
+    if value is not _MISSING:
+        new_link.speed_pattern = value
+    return new_link
+
+
+def _build_valve(name: str, link, converter, length: float, diameter: float) -> Valve:
+    """Build a Valve from a WNTR valve (diameter already in project units)."""
+    from_node, to_node = _link_ends(link)
+    
+    new_link = Valve(
+        id=name,
+        valve_type=LinkType.PRV, # Default, need to check type
+        from_node=from_node,
+        to_node=to_node,
+        diameter=diameter
+    )
+    # Map valve type
+    valve_type = getattr(link, 'valve_type', _MISSING)
+    if valve_type is not _MISSING:
+        vt = _wntr_key(valve_type)
+        new_link.link_type = _VALVE_TYPE_MAP.get(vt, new_link.link_type)
+
+    setting = getattr(link, 'setting', _MISSING)
+    if setting is not _MISSING:
+        if new_link.link_type in _PRESSURE_VALVE_TYPES:
+            setting = converter.pressure_to_project(setting)
+        elif new_link.link_type == LinkType.FCV:
+            setting = converter.flow_to_project(setting)
+
+        new_link.valve_setting = setting
+
+    value = getattr(link, 'minor_loss', _MISSING)
+    if value is not _MISSING:
+        new_link.minor_loss = value
+    return new_link
+
+
+# WNTR link class -> builder; subclasses (HeadPump, PRValve, ...) are added
+# on first sight by _class_builder
+_LINK_BUILDERS = {
+    wntr.network.Pipe: _build_pipe,
+    wntr.network.Pump: _build_pump,
+    wntr.network.Valve: _build_valve
+}
+
+
+def _build_junction(name: str, node, converter, x: float, y: float, elevation: float) -> Junction:
+    """Build a Junction from a WNTR junction (elevation in project units)."""
+    # Base Demand is flow (CMS -> Project Flow Units)
+    # Note: WNTR base_demand is usually in CMS
+    base_demand = converter.flow_to_project(node.base_demand)
+
+    new_node = Junction(
+        id=name,
+        x=x, y=y,
+        elevation=elevation,
+        base_demand=base_demand
+    )
+    value = getattr(node, 'demand_pattern_name', _MISSING)
+    if value is not _MISSING:
+        new_node.demand_pattern = value
+    return new_node
+
+
+def _build_reservoir(name: str, node, converter, x: float, y: float, elevation: float) -> Reservoir:
+    """Build a Reservoir from a WNTR reservoir."""
+    # Reservoir Head is Length (m -> ft if US)
+    base_head = getattr(node, 'base_head', 0.0)
+    # If using pattern, base_head might be 0 or mean something else
+    total_head = converter.length_to_project(base_head)
+
+    new_node = Reservoir(
+        id=name,
+        x=x, y=y,
+        elevation=0.0, # Reservoirs don't have elevation property in EPANET GUI usually, just Total Head
+        total_head=total_head
+    )
+    value = getattr(node, 'head_pattern_name', _MISSING)
+    if value is not _MISSING:
+        new_node.head_pattern = value
+    return new_node
+
+
+def _build_tank(name: str, node, converter, x: float, y: float, elevation: float) -> Tank:
+    """Build a Tank from a WNTR tank (elevation in project units)."""
+    # Tank Levels are Length (m -> ft)
+    # Tank Diameter is Diameter (m -> in/mm)
+
+    init_level, min_level, max_level, min_vol, diameter = _TANK_GET(node)
+    init_level = converter.length_to_project(init_level)
+    min_level = converter.length_to_project(min_level)
+    max_level = converter.length_to_project(max_level)
+    # Volume is usually m3. Need volume conversion? 
+
+    vol_factor = 35.3147 if converter.system == UnitSystem.US else 1.0
+    min_vol = min_vol * vol_factor
+
+    diameter = converter.diameter_to_project(diameter)
+
+    new_node = Tank(
+        id=name,
+        x=x, y=y,
+        elevation=elevation,
+        init_level=init_level,
+        min_level=min_level,
+        max_level=max_level,
+        diameter=diameter,
+        min_volume=min_vol,
+        volume_curve=getattr(node, 'vol_curve_name', None)
+    )
+
+    # Mixing Model
+    mixing_model = getattr(node, 'mixing_model', _MISSING)
+    if mixing_model is not _MISSING:
+        mix_str = _wntr_key(mixing_model)
+        new_node.mixing_model = _MIXING_MODEL_MAP.get(mix_str, MixingModel.MIX1)
+    value = getattr(node, 'mixing_fraction', _MISSING)
+    if value is not _MISSING:
+        new_node.mixing_fraction = value
+    value = getattr(node, 'bulk_reaction_coefficient', _MISSING)
+    if value is not _MISSING:
+        new_node.bulk_coeff = value
+    return new_node
+
+
+# WNTR node class -> builder
+_NODE_BUILDERS = {
+    wntr.network.Junction: _build_junction,
+    wntr.network.Reservoir: _build_reservoir,
+    wntr.network.Tank: _build_tank
+}
+
+
+def _class_builder(builders: Dict[type, Callable], cls) -> Optional[Callable]:
+    """Find the builder for a WNTR class in a class-keyed builder table."""
+    builder = builders.get(cls)
+    if builder is None:
+        for base in cls.__mro__[1:]:
+            builder = builders.get(base)
+            if builder is not None:
+                builders[cls] = builder
+                break
+    return builder
 
 
 class EPANETProject:
@@ -22,6 +653,19 @@ class EPANETProject:
         self.last_report = "No simulation run yet."
         self.backdrop_info = None
         
+        # Simple controls currently held by the WNTR model, keyed by their
+        # EPANET text (also used as the WNTR control name)
+        self._synced_controls = set()
+        
+        # Node/link attribute snapshots as of the last sync, keyed by ID, the
+        # flow units they were converted with, the synced options values and
+        # pattern multipliers; reset with the WNTR model
+        self._synced_nodes = {}
+        self._synced_links = {}
+        self._synced_units = None
+        self._synced_options = None
+        self._synced_patterns = {}
+        
         # Default Properties and Prefixes
         self.default_properties = {}
         self.default_prefixes = {
@@ -31,6 +675,10 @@ class EPANETProject:
         }
         self.id_increment = 1
         
+        # Next free number per (collection, prefix); cleared whenever the
+        # network is replaced or id_increment is reassigned
+        self._next_id = {}
+        
         self.default_hydraulics = {
             'flow_units': 'LPS',
             'headloss_formula': 'H-W',
@@ -78,7 +726,9 @@ class EPANETProject:
     def new_project(self) -> None:
         """Create a new empty project."""
         self.network.clear()
+        self._next_id.clear()
         self.engine.close_project()
+        self._reset_sync_state()
         self.filename = ""
         self.modified = False
         self._has_results = False
@@ -91,19 +741,13 @@ class EPANETProject:
         
         # Flow Units
         fu_str = dh.get('flow_units', 'LPS')
-        fu_map = {
-            'CFS': FlowUnits.CFS, 'GPM': FlowUnits.GPM, 'MGD': FlowUnits.MGD,
-            'IMGD': FlowUnits.IMGD, 'AFD': FlowUnits.AFD, 'LPS': FlowUnits.LPS,
-            'LPM': FlowUnits.LPM, 'MLD': FlowUnits.MLD, 'CMH': FlowUnits.CMH,
-            'CMD': FlowUnits.CMD
-        }
-        opts.flow_units = fu_map.get(fu_str, FlowUnits.LPS)
+        opts.flow_units = _FLOW_UNITS_MAP.get(fu_str, FlowUnits.LPS)
         
         # Headloss
         hl_str = dh.get('headloss_formula', 'H-W')
-        if 'H-W' in hl_str: opts.headloss_formula = HeadLossType.HW
-        elif 'D-W' in hl_str: opts.headloss_formula = HeadLossType.DW
-        elif 'C-M' in hl_str: opts.headloss_formula = HeadLossType.CM
+        headloss_type = _HEADLOSS_MAP.get(hl_str.replace('-', ''))
+        if headloss_type is not None:
+            opts.headloss_formula = headloss_type
         
         opts.specific_gravity = float(dh.get('specific_gravity', 1.0))
         opts.viscosity = float(dh.get('viscosity', 1.0))
@@ -139,10 +783,8 @@ class EPANETProject:
             raise ValueError("No filename specified")
             
         try:
-            # Sync network model back to WNTR object before saving
-            self._sync_network_to_wntr()
-            
-            # Use epanet_io.export_network to save, as it handles controls/rules
+            # Use epanet_io.export_network to save, as it handles controls/rules;
+            # it syncs the network model back to the WNTR object itself
             from core.epanet_io import export_network
             export_network(self, filename)
             
@@ -152,452 +794,429 @@ class EPANETProject:
             raise Exception(f"Failed to save project: {e}")
 
     def _sync_network_to_wntr(self) -> None:
-        """Sync internal network model to WNTR model."""
-        import wntr
-        from core.units import UnitConverter, UnitSystem
+        """Sync internal network model to WNTR model.
         
+        Sections run in dependency order: links need their end nodes, and
+        controls need their links, to already exist in the WNTR model.
+        """
         # Create WNTR model if it doesn't exist
         if not self.engine.wn:
             self.engine.wn = wntr.network.WaterNetworkModel()
+            self._synced_controls = set()
+            self._reset_sync_state()
             
         wn = self.engine.wn
         
         # Initialize Unit Converter
-        converter = UnitConverter(self.network.options.flow_units)
+        converter = get_converter(self.network.options.flow_units)
+        
+        # Every converted value changes with the flow units
+        if self._synced_units != self.network.options.flow_units:
+            if self._synced_units is not None:
+                # Control thresholds/settings were parsed to SI with the old
+                # units; drop them so _sync_controls re-parses their text
+                for text in self._synced_controls:
+                    if text in wn.control_name_list:
+                        wn.remove_control(text)
+                self._synced_controls.clear()
+            self._reset_sync_state()
+            self._synced_units = self.network.options.flow_units
             
         # Project Info
         if hasattr(wn, 'title'):
             wn.title = self.network.title
             
-        # Nodes
-        for node in self.network.nodes.values():
-            # Add node if not exists
-            if node.id not in wn.nodes:
-                if node.node_type == NodeType.JUNCTION:
-                    # Elevation: Project -> SI
-                    elev_si = converter.length_to_si(node.elevation)
-                    wn.add_junction(node.id, elevation=elev_si, coordinates=(node.x, node.y))
-                elif node.node_type == NodeType.RESERVOIR:
-                    # Total Head: Project -> SI
-                    head_si = converter.length_to_si(node.total_head)
-                    wn.add_reservoir(node.id, base_head=head_si, coordinates=(node.x, node.y))
-                elif node.node_type == NodeType.TANK:
-                    # Elevation/Levels: Project -> SI
-                    elev_si = converter.length_to_si(node.elevation or 0.0)
-                    init_si = converter.length_to_si(node.init_level or 0.0)
-                    min_si = converter.length_to_si(node.min_level or 0.0)
-                    max_si = converter.length_to_si(node.max_level or 0.0)
-                    # Diameter: Project -> SI (m)
-                    diam_si = converter.diameter_to_si(node.diameter or 0.0)
-                    
-                    wn.add_tank(node.id, elevation=elev_si, 
-                               init_level=init_si, 
-                               min_level=min_si, 
-                               max_level=max_si, 
-                               diameter=diam_si, 
-                               coordinates=(node.x, node.y))
-            
-            # Update properties
-            if node.id in wn.nodes:
-                wn_node = wn.nodes[node.id]
-                wn_node.coordinates = (node.x, node.y)
-                
-                # Common properties
-                if hasattr(wn_node, 'elevation') and hasattr(node, 'elevation') and node.elevation is not None:
-                    wn_node.elevation = converter.length_to_si(node.elevation)
-                if hasattr(wn_node, 'tag'):
-                    wn_node.tag = node.tag
-                    
-                # Junction specific
-                if hasattr(wn_node, 'base_demand') and hasattr(node, 'base_demand') and node.base_demand is not None:
-                    # Base Demand: Project -> SI (CMS)
-                    base_demand_si = converter.flow_to_si(node.base_demand)
-                    
-                    # WNTR base_demand is read-only, need to set via demand_timeseries_list
-                    if hasattr(wn_node, 'demand_timeseries_list') and len(wn_node.demand_timeseries_list) > 0:
-                        wn_node.demand_timeseries_list[0].base_value = base_demand_si
-                    else:
-                        # Fallback if no demand list exists (shouldn't happen for standard junctions)
-                        pass
-                if hasattr(wn_node, 'demand_pattern_name') and hasattr(node, 'demand_pattern'):
-                    wn_node.demand_pattern_name = node.demand_pattern or ""
-                if hasattr(wn_node, 'emitter_coefficient') and hasattr(node, 'emitter_coeff') and node.emitter_coeff is not None:
-                    wn_node.emitter_coefficient = node.emitter_coeff
-                    
-                # Reservoir specific
-                if hasattr(wn_node, 'base_head') and hasattr(node, 'total_head') and node.total_head is not None:
-                    wn_node.base_head = converter.length_to_si(node.total_head)
-                if hasattr(wn_node, 'head_pattern_name') and hasattr(node, 'head_pattern'):
-                    wn_node.head_pattern_name = node.head_pattern or ""
-                    
-                # Tank specific
-                if hasattr(wn_node, 'init_level') and hasattr(node, 'init_level') and node.init_level is not None:
-                    wn_node.init_level = converter.length_to_si(node.init_level)
-                if hasattr(wn_node, 'min_level') and hasattr(node, 'min_level') and node.min_level is not None:
-                    wn_node.min_level = converter.length_to_si(node.min_level)
-                if hasattr(wn_node, 'max_level') and hasattr(node, 'max_level') and node.max_level is not None:
-                    wn_node.max_level = converter.length_to_si(node.max_level)
-                if hasattr(wn_node, 'diameter') and hasattr(node, 'diameter') and node.diameter is not None:
-                    wn_node.diameter = converter.diameter_to_si(node.diameter)
-                if hasattr(wn_node, 'min_volume') and hasattr(node, 'min_volume') and node.min_volume is not None:
-                    # Volume: Project -> SI (m3)
-                    vol_factor = 35.3147 if converter.system == UnitSystem.US else 1.0
-                    wn_node.min_volume = node.min_volume / vol_factor
-                if hasattr(wn_node, 'vol_curve_name') and hasattr(node, 'volume_curve'):
-                    wn_node.vol_curve_name = node.volume_curve or ""
-                if hasattr(wn_node, 'mixing_model') and hasattr(node, 'mixing_model'):
-                    # Map MixingModel enum to WNTR string
-                    mix_map = {
-                        MixingModel.MIX1: 'MIXED',
-                        MixingModel.MIX2: '2COMP',
-                        MixingModel.FIFO: 'FIFO',
-                        MixingModel.LIFO: 'LIFO'
-                    }
-                    wn_node.mixing_model = mix_map.get(node.mixing_model, 'MIXED')
-                if hasattr(wn_node, 'mixing_fraction') and hasattr(node, 'mixing_fraction') and node.mixing_fraction is not None:
-                    wn_node.mixing_fraction = node.mixing_fraction
-                if hasattr(wn_node, 'bulk_reaction_coefficient') and hasattr(node, 'bulk_coeff') and node.bulk_coeff is not None:
-                    wn_node.bulk_reaction_coefficient = node.bulk_coeff
-                    
-        # Links
-        for link in self.network.links.values():
-            # Add link if not exists
-            if link.id not in wn.links:
-                if link.link_type == LinkType.PIPE:
-                    # Length: Project -> SI
-                    length_si = converter.length_to_si(link.length or 0.0)
-                    # Diameter: Project -> SI
-                    diam_si = converter.diameter_to_si(link.diameter or 0.0)
-                    
-                    wn.add_pipe(link.id, link.from_node, link.to_node, 
-                               length=length_si, 
-                               diameter=diam_si, 
-                               roughness=(link.roughness or 0.0))
-                elif link.link_type == LinkType.PUMP:
-                    wn.add_pump(link.id, link.from_node, link.to_node)
-                elif link.link_type in [LinkType.PRV, LinkType.PSV, LinkType.PBV, LinkType.FCV, LinkType.TCV, LinkType.GPV]:
-                    # WNTR add_valve requires type
-                    valve_type = "PRV" # Default
-                    if link.link_type == LinkType.PRV: valve_type = "PRV"
-                    elif link.link_type == LinkType.PSV: valve_type = "PSV"
-                    elif link.link_type == LinkType.PBV: valve_type = "PBV"
-                    elif link.link_type == LinkType.FCV: valve_type = "FCV"
-                    elif link.link_type == LinkType.TCV: valve_type = "TCV"
-                    elif link.link_type == LinkType.GPV: valve_type = "GPV"
-                    
-                    # Diameter: Project -> SI
-                    diam_si = converter.diameter_to_si(link.diameter or 0.0)
-                    
-                    wn.add_valve(link.id, link.from_node, link.to_node, 
-                                diameter=diam_si, 
-                                valve_type=valve_type)
-
-            # Update properties
-            if link.id in wn.links:
-                wn_link = wn.links[link.id]
-                
-                # Common properties
-                if hasattr(wn_link, 'tag'):
-                    wn_link.tag = link.tag
-                if hasattr(wn_link, 'status'):
-                    status_map = {
-                        LinkStatus.OPEN: 'OPEN',
-                        LinkStatus.CLOSED: 'CLOSED',
-                        LinkStatus.CV: 'CV'
-                    }
-                    new_status = status_map.get(link.status, 'OPEN')
-                    
-                    # WNTR Pipe status is read-only property that reflects current simulation state
-                    # To set initial status, use initial_status
-                    if hasattr(wn_link, 'initial_status'):
-                        wn_link.initial_status = new_status
-                    else:
-                        # Try setting status directly if it's not read-only (e.g. for Pumps/Valves it might be settable)
-                        try:
-                            wn_link.status = new_status
-                        except AttributeError:
-                            pass
-                
-                # Pipe specific
-                if hasattr(wn_link, 'length') and hasattr(link, 'length') and link.length is not None:
-                    wn_link.length = converter.length_to_si(link.length)
-                if hasattr(wn_link, 'diameter') and hasattr(link, 'diameter') and link.diameter is not None:
-                    wn_link.diameter = converter.diameter_to_si(link.diameter)
-                if hasattr(wn_link, 'roughness') and hasattr(link, 'roughness') and link.roughness is not None:
-                    wn_link.roughness = link.roughness
-                if hasattr(wn_link, 'minor_loss') and hasattr(link, 'minor_loss') and link.minor_loss is not None:
-                    wn_link.minor_loss = link.minor_loss
-                if hasattr(wn_link, 'bulk_reaction_coefficient') and hasattr(link, 'bulk_coeff') and link.bulk_coeff is not None:
-                    wn_link.bulk_reaction_coefficient = link.bulk_coeff
-                if hasattr(wn_link, 'wall_reaction_coefficient') and hasattr(link, 'wall_coeff') and link.wall_coeff is not None:
-                    wn_link.wall_reaction_coefficient = link.wall_coeff
-                    
-                # Pump specific
-                if hasattr(wn_link, 'pump_curve_name') and hasattr(link, 'pump_curve'):
-                    wn_link.pump_curve_name = link.pump_curve or ""
-                if hasattr(wn_link, 'power') and hasattr(link, 'power') and link.power is not None:
-                    # Power: Project -> SI (Watts)
-                    power = link.power
-                    if converter.system == UnitSystem.US:
-                        power = power * 745.7 # HP -> Watts
-                    else:
-                        power = power * 1000.0 # kW -> Watts
-                    wn_link.power = power
-                if hasattr(wn_link, 'speed_pattern_name') and hasattr(link, 'speed_pattern'):
-                    wn_link.speed_pattern_name = link.speed_pattern or ""
-                    
-                # Valve specific
-                if hasattr(wn_link, 'setting') and hasattr(link, 'valve_setting') and link.valve_setting is not None:
-                    setting = link.valve_setting
-                    if link.link_type in [LinkType.PRV, LinkType.PSV, LinkType.PBV]:
-                        setting = converter.pressure_to_si(setting)
-                    elif link.link_type == LinkType.FCV:
-                        setting = converter.flow_to_si(setting)
-                    
-                    wn_link.setting = setting
+        self._sync_nodes(wn, converter)
+        self._sync_links(wn, converter)
         
         # Controls
         if hasattr(wn, 'controls'):
-            # Clear existing controls first (simplest approach for now)
-            # Note: WNTR doesn't have a clear_controls method, need to remove one by one or replace list
-            # But directly modifying internal dicts is risky. 
-            # Best to remove all known controls and re-add.
-            # For now, let's assume we can overwrite or add.
-            # Actually, WNTR controls are stored in wn.control_name_registry and wn.controls
-            
-            # Remove all existing controls
-            # control_names = getattr(wn, 'control_name_list', list(wn.controls.keys()))
-            # for name in list(control_names):
-            #      wn.remove_control(name)
-                 
-            # Add simple controls
-            for i, control in enumerate(self.network.controls):
-                control_obj = None
-                # We need to construct WNTR control objects from our SimpleControl string representation
-                # This is tricky because WNTR expects objects, not strings.
-                # However, WNTR has a way to parse controls if we were loading an INP file.
-                # Since we are manually building, we might need to use WNTR's API.
-                
-                # For Simple Controls (LINK X STATUS AT TIME Y / IF NODE Z ...)
-                # WNTR has Control, Rule, etc.
-                
-                # Easier approach: Use WNTR's internal parser logic or just skip detailed object creation 
-                # if we only care about saving to INP. But we want to run simulation too.
+            self._sync_controls(wn)
+        
+        # Rules are written from the internal model by export_network
+        
+        self._sync_options(wn)
+        self._sync_patterns(wn)
+        self._sync_curves(wn, converter)
+        
+        # Labels (WNTR supports labels?)
+        # WNTR 0.4+ has labels support usually in wn.labels
+        # But write_inpfile might not support writing them if they are not standard objects
+        # WNTR stores labels as tuples (x, y, text, anchor_node) in a list or dict
+        # Let's check if we can add them.
+        # If not, we skip labels for now as they are visual only.
+    
+    def _reset_sync_state(self) -> None:
+        """Forget the sync snapshots so the next sync rewrites every element."""
+        self._synced_nodes = {}
+        self._synced_links = {}
+        self._synced_units = None
+        self._synced_options = None
+        self._synced_patterns = {}
+    
+    def _sync_nodes(self, wn, converter) -> None:
+        """Add missing nodes to the WNTR model and update their properties."""
+        # Project -> SI factors, resolved once instead of per converter call
+        len_f = converter.length_to_si(1.0)
+        diam_f = converter.diameter_to_si(1.0)
+        flow_f = converter.flow_to_si(1.0)
+        vol_f = 35.3147 if converter.system == UnitSystem.US else 1.0
+        
+        wn_nodes = wn.nodes
+        add_junction = wn.add_junction
+        add_reservoir = wn.add_reservoir
+        add_tank = wn.add_tank
+        
+        synced = self._synced_nodes
+        changed = {}
+        
+        # Add missing nodes first, in project order, then update each type in its
+        # own pass; nodes unchanged since the last sync are skipped entirely
+        for node in self.network.nodes.values():
+            if node.id in wn_nodes:
+                continue
+            synced.pop(node.id, None)
+            if node.node_type == NodeType.JUNCTION:
+                # Elevation: Project -> SI
+                elev_si = node.elevation * len_f
+                add_junction(node.id, elevation=elev_si, coordinates=(node.x, node.y))
+            elif node.node_type == NodeType.RESERVOIR:
+                # Total Head: Project -> SI
+                head_si = node.total_head * len_f
+                add_reservoir(node.id, base_head=head_si, coordinates=(node.x, node.y))
+            elif node.node_type == NodeType.TANK:
+                # Elevation/Levels: Project -> SI
+                elev_si = (node.elevation or 0.0) * len_f
+                init_si = (node.init_level or 0.0) * len_f
+                min_si = (node.min_level or 0.0) * len_f
+                max_si = (node.max_level or 0.0) * len_f
+                # Diameter: Project -> SI (m)
+                diam_si = (node.diameter or 0.0) * diam_f
                 
-                # Let's try to parse our SimpleControl back to WNTR objects.
-                # This requires mapping our SimpleControl fields to WNTR Control objects.
+                add_tank(node.id, elevation=elev_si, 
+                         init_level=init_si, 
+                         min_level=min_si, 
+                         max_level=max_si, 
+                         diameter=diam_si, 
+                         coordinates=(node.x, node.y))
+        caps_cache = {}
+        
+        node_column = self.network.node_column
+        
+        # Junctions; numeric fields are converted (Project -> SI) a column at a
+        # time, NaN marking a missing value
+        juncs = _unsynced(self.network.junctions, synced, changed, _NODE_STATE_FIELDS)
+        elevs_si = (node_column('elevation', juncs) * len_f).tolist()
+        demands_si = (node_column('base_demand', juncs) * flow_f).tolist() # CMS
+        for node, elev_si, base_demand_si in zip(juncs, elevs_si, demands_si):
+            wn_node = wn_nodes[node.id]
+            wn_node.coordinates = (node.x, node.y)
+            caps = _sync_capabilities(caps_cache, wn_node, node, _NODE_SYNC_ATTRS)
+            
+            if 'elevation' in caps and not isnan(elev_si):
+                wn_node.elevation = elev_si
+            if 'tag' in caps:
+                wn_node.tag = node.tag
+            if 'base_demand' in caps and not isnan(base_demand_si):
+                # WNTR base_demand is read-only, need to set via demand_timeseries_list
+                if 'demand_timeseries_list' in caps and len(wn_node.demand_timeseries_list) > 0:
+                    wn_node.demand_timeseries_list[0].base_value = base_demand_si
+                else:
+                    # Fallback if no demand list exists (shouldn't happen for standard junctions)
+                    pass
+            if 'demand_pattern_name' in caps:
+                wn_node.demand_pattern_name = node.demand_pattern or ""
+            if 'emitter_coefficient' in caps and node.emitter_coeff is not None:
+                wn_node.emitter_coefficient = node.emitter_coeff
+        
+        # Reservoirs
+        reservoirs = _unsynced(self.network.reservoirs, synced, changed, _NODE_STATE_FIELDS)
+        elevs_si = (node_column('elevation', reservoirs) * len_f).tolist()
+        heads_si = (node_column('total_head', reservoirs) * len_f).tolist()
+        for node, elev_si, head_si in zip(reservoirs, elevs_si, heads_si):
+            wn_node = wn_nodes[node.id]
+            wn_node.coordinates = (node.x, node.y)
+            caps = _sync_capabilities(caps_cache, wn_node, node, _NODE_SYNC_ATTRS)
+            
+            if 'elevation' in caps and not isnan(elev_si):
+                wn_node.elevation = elev_si
+            if 'tag' in caps:
+                wn_node.tag = node.tag
+            if 'base_head' in caps and not isnan(head_si):
+                wn_node.base_head = head_si
+            if 'head_pattern_name' in caps:
+                wn_node.head_pattern_name = node.head_pattern or ""
+        
+        # Tanks
+        tanks = _unsynced(self.network.tanks, synced, changed, _NODE_STATE_FIELDS)
+        tank_columns = zip(
+            (node_column('elevation', tanks) * len_f).tolist(),
+            (node_column('init_level', tanks) * len_f).tolist(),
+            (node_column('min_level', tanks) * len_f).tolist(),
+            (node_column('max_level', tanks) * len_f).tolist(),
+            (node_column('diameter', tanks) * diam_f).tolist(),
+            (node_column('min_volume', tanks) / vol_f).tolist(), # m3
+        )
+        for node, (elev_si, init_si, min_si, max_si, diam_si, min_vol_si) in zip(tanks, tank_columns):
+            wn_node = wn_nodes[node.id]
+            wn_node.coordinates = (node.x, node.y)
+            caps = _sync_capabilities(caps_cache, wn_node, node, _NODE_SYNC_ATTRS)
+            
+            if 'elevation' in caps and not isnan(elev_si):
+                wn_node.elevation = elev_si
+            if 'tag' in caps:
+                wn_node.tag = node.tag
+            if 'init_level' in caps and not isnan(init_si):
+                wn_node.init_level = init_si
+            if 'min_level' in caps and not isnan(min_si):
+                wn_node.min_level = min_si
+            if 'max_level' in caps and not isnan(max_si):
+                wn_node.max_level = max_si
+            if 'diameter' in caps and not isnan(diam_si):
+                wn_node.diameter = diam_si
+            if 'min_volume' in caps and not isnan(min_vol_si):
+                wn_node.min_volume = min_vol_si
+            if 'vol_curve_name' in caps:
+                wn_node.vol_curve_name = node.volume_curve or ""
+            if 'mixing_model' in caps:
+                wn_node.mixing_model = _MIXING_NAME.get(node.mixing_model, 'MIXED')
+            if 'mixing_fraction' in caps and node.mixing_fraction is not None:
+                wn_node.mixing_fraction = node.mixing_fraction
+            if 'bulk_reaction_coefficient' in caps and node.bulk_coeff is not None:
+                wn_node.bulk_reaction_coefficient = node.bulk_coeff
+        
+        synced.update(changed)
+    
+    def _sync_links(self, wn, converter) -> None:
+        """Add missing links to the WNTR model and update their properties."""
+        # Project -> SI factors, resolved once instead of per converter call
+        len_f = converter.length_to_si(1.0)
+        diam_f = converter.diameter_to_si(1.0)
+        flow_f = converter.flow_to_si(1.0)
+        press_f = converter.pressure_to_si(1.0)
+        power_f = 745.7 if converter.system == UnitSystem.US else 1000.0 # HP or kW -> Watts
+        
+        wn_links = wn.links
+        add_pipe = wn.add_pipe
+        add_pump = wn.add_pump
+        add_valve = wn.add_valve
+        
+        synced = self._synced_links
+        changed = {}
+        
+        # Add missing links first, in project order, then update each type in its
+        # own pass; links unchanged since the last sync are skipped entirely
+        for link in self.network.links.values():
+            if link.id in wn_links:
+                continue
+            synced.pop(link.id, None)
+            link_type = link.link_type
+            if link_type == LinkType.PIPE:
+                add_pipe(link.id, link.from_node, link.to_node, 
+                         length=(link.length or 0.0) * len_f, 
+                         diameter=(link.diameter or 0.0) * diam_f, 
+                         roughness=(link.roughness or 0.0))
+            elif link_type == LinkType.PUMP:
+                add_pump(link.id, link.from_node, link.to_node)
+            elif link_type in _VALVE_TYPES:
+                # WNTR add_valve requires type; the LinkType names are the EPANET codes
+                add_valve(link.id, link.from_node, link.to_node, 
+                          diameter=(link.diameter or 0.0) * diam_f, 
+                          valve_type=link_type.name)
+        caps_cache = {}
+        
+        # Pipes (check-valve pipes are never added above, so may be missing)
+        pipes = _unsynced(self.network.pipes, synced, changed, _LINK_STATE_FIELDS)
+        
+        # Length/Diameter: Project -> SI, converted for all changed pipes at once
+        lengths_si = converter.length_to_si(self.network.link_column('length', pipes)).tolist()
+        diameters_si = converter.diameter_to_si(self.network.link_column('diameter', pipes)).tolist()
+        for link, length_si, diam_si in zip(pipes, lengths_si, diameters_si):
+            wn_link = wn_links.get(link.id)
+            if wn_link is None:
+                continue
+            caps = _sync_capabilities(caps_cache, wn_link, link, _LINK_SYNC_ATTRS)
+            _sync_link_common(wn_link, link, caps)
+            
+            if 'length' in caps and not isnan(length_si):
+                wn_link.length = length_si
+            if 'diameter' in caps and not isnan(diam_si):
+                wn_link.diameter = diam_si
+            if 'roughness' in caps and link.roughness is not None:
+                wn_link.roughness = link.roughness
+            if 'minor_loss' in caps and link.minor_loss is not None:
+                wn_link.minor_loss = link.minor_loss
+            if 'bulk_reaction_coefficient' in caps and link.bulk_coeff is not None:
+                wn_link.bulk_reaction_coefficient = link.bulk_coeff
+            if 'wall_reaction_coefficient' in caps and link.wall_coeff is not None:
+                wn_link.wall_reaction_coefficient = link.wall_coeff
+        
+        # Pumps
+        for link in _unsynced(self.network.pumps, synced, changed, _LINK_STATE_FIELDS):
+            wn_link = wn_links[link.id]
+            caps = _sync_capabilities(caps_cache, wn_link, link, _LINK_SYNC_ATTRS)
+            _sync_link_common(wn_link, link, caps)
+            
+            if 'pump_curve_name' in caps:
+                wn_link.pump_curve_name = link.pump_curve or ""
+            if 'power' in caps and link.power is not None:
+                # Power: Project -> SI (Watts)
+                wn_link.power = link.power * power_f
+            if 'speed_pattern_name' in caps:
+                wn_link.speed_pattern_name = link.speed_pattern or ""
+        
+        # Valves
+        valves = _unsynced(self.network.valves, synced, changed, _LINK_STATE_FIELDS)
+        diameters_si = converter.diameter_to_si(self.network.link_column('diameter', valves)).tolist()
+        for link, diam_si in zip(valves, diameters_si):
+            link_type = link.link_type
+            wn_link = wn_links[link.id]
+            caps = _sync_capabilities(caps_cache, wn_link, link, _LINK_SYNC_ATTRS)
+            _sync_link_common(wn_link, link, caps)
+            
+            if 'diameter' in caps and not isnan(diam_si):
+                wn_link.diameter = diam_si
+            if 'minor_loss' in caps and link.minor_loss is not None:
+                wn_link.minor_loss = link.minor_loss
+            if 'setting' in caps and link.valve_setting is not None:
+                setting = link.valve_setting
+                if link_type in _PRESSURE_VALVE_TYPES:
+                    setting = setting * press_f
+                elif link_type == LinkType.FCV:
+                    setting = setting * flow_f
                 
-                # Example: LINK <linkid> <status> IF NODE <nodeid> <operator> <value>
-                if control.control_type == "IF_NODE":
-                    # Conditional control
-                    try:
-                        link = wn.get_link(control.link_id)
-                        node = wn.get_node(control.node_id)
-                        
-                        # Operator mapping
-                        op = np.less if control.operator == "BELOW" else np.greater
-                        # WNTR uses different operators? 
-                        # wntr.network.controls.Comparison(func, threshold)
-                        
-                        # Actually, WNTR's API for adding controls:
-                        # wn.add_control(name, control_obj)
-                        # control_obj = wntr.network.controls.Control(condition, action, name)
-                        
-                        # This is getting complex to map perfectly without more WNTR knowledge.
-                        # However, for the purpose of this task (Alignment), maybe we can just ensure
-                        # they are preserved as strings if WNTR allows, OR we implement a basic mapping.
-                        
-                        # Given the complexity, and that we want to save/load, maybe we should rely on
-                        # WNTR's ability to read/write INP.
-                        # But we are modifying the WNTR object in memory.
-                        
-                        # Alternative: We don't sync controls TO WNTR here if we can't do it perfectly.
-                        # But then running simulation won't respect new controls.
-                        
-                        # Let's implement basic support for what we can.
-                        pass
-                    except:
-                        pass
-                        
-            # For now, to avoid breaking things with partial implementation, 
-            # we will skip syncing controls TO WNTR in this step and focus on UI editing.
-            # The user asked to "Align Delphi GUI Functionality", which implies UI first.
-            # But "Run Analysis" needs them.
-            
-            # Let's look at how we load them. We load them as strings.
-            # Maybe we can just keep them as strings in Network, and when saving, 
-            # we might need to handle them.
-            
-            # Wait, the prompt says "identifying features... and implementing or porting them".
-            # If I can't easily sync to WNTR object, I should at least ensure they are saved.
-            # But WNTR save_inp writes from its internal object.
-            
-            # Let's try to implement a helper to convert SimpleControl to WNTR Control.
-            pass
-
-        # Rules
-        if hasattr(wn, 'rules'):
-             # Similar issue with Rules.
-             pass
+                wn_link.setting = setting
         
-        # Sync Options to WNTR
+        synced.update(changed)
+    
+    def _sync_options(self, wn) -> None:
+        """Sync analysis options to the WNTR model (skipped if unchanged)."""
         if hasattr(wn, 'options'):
             opts = self.network.options
+            state = _OPTION_STATE(opts)
+            if state == self._synced_options:
+                return
+            hydraulic = wn.options.hydraulic
+            quality = wn.options.quality
             
             # Hydraulics
-            if hasattr(wn.options.hydraulic, 'flow_units'):
-                wn.options.hydraulic.flow_units = opts.flow_units.name
-            elif hasattr(wn.options.hydraulic, 'inpfile_units'): # WNTR 1.x fallback
-                wn.options.hydraulic.inpfile_units = opts.flow_units.name
-
-            if hasattr(wn.options.hydraulic, 'headloss'):
-                if opts.headloss_formula == HeadLossType.HW:
-                    wn.options.hydraulic.headloss = 'H-W'
-                elif opts.headloss_formula == HeadLossType.DW:
-                    wn.options.hydraulic.headloss = 'D-W'
-                elif opts.headloss_formula == HeadLossType.CM:
-                    wn.options.hydraulic.headloss = 'C-M'
-            
-            if hasattr(wn.options.hydraulic, 'viscosity'):
-                wn.options.hydraulic.viscosity = opts.viscosity
-            if hasattr(wn.options.hydraulic, 'specific_gravity'):
-                wn.options.hydraulic.specific_gravity = opts.specific_gravity
-            if hasattr(wn.options.hydraulic, 'trials'):
-                wn.options.hydraulic.trials = opts.trials
-            if hasattr(wn.options.hydraulic, 'accuracy'):
-                wn.options.hydraulic.accuracy = opts.accuracy
-            if hasattr(wn.options.hydraulic, 'demand_multiplier'):
-                wn.options.hydraulic.demand_multiplier = opts.demand_multiplier
-            if hasattr(wn.options.hydraulic, 'emitter_exponent'):
-                wn.options.hydraulic.emitter_exponent = opts.emitter_exponent
+            if hasattr(hydraulic, 'flow_units'):
+                hydraulic.flow_units = opts.flow_units.name
+            elif hasattr(hydraulic, 'inpfile_units'): # WNTR 1.x fallback
+                hydraulic.inpfile_units = opts.flow_units.name
+
+            headloss = _HEADLOSS_NAME.get(opts.headloss_formula)
+            if headloss is not None and hasattr(hydraulic, 'headloss'):
+                hydraulic.headloss = headloss
             
             # Quality
-            if hasattr(wn.options.quality, 'parameter'):
-                if opts.quality_type == QualityType.NONE:
-                    wn.options.quality.parameter = 'NONE'
-                elif opts.quality_type == QualityType.CHEM:
-                    wn.options.quality.parameter = 'CHEMICAL'
-                elif opts.quality_type == QualityType.AGE:
-                    wn.options.quality.parameter = 'AGE'
-                elif opts.quality_type == QualityType.TRACE:
-                    wn.options.quality.parameter = 'TRACE'
-            
-            if hasattr(wn.options.quality, 'diffusivity'):
-                wn.options.quality.diffusivity = opts.diffusivity
-            if hasattr(wn.options.quality, 'tolerance'):
-                wn.options.quality.tolerance = opts.quality_tolerance
-            
-            # Reactions
-            if hasattr(wn.options.reaction, 'bulk_order'):
-                wn.options.reaction.bulk_order = opts.bulk_order
-            if hasattr(wn.options.reaction, 'wall_order'):
-                wn.options.reaction.wall_order = opts.wall_order
-            if hasattr(wn.options.reaction, 'bulk_coeff'):
-                wn.options.reaction.bulk_coeff = opts.global_bulk_coeff
-            if hasattr(wn.options.reaction, 'wall_coeff'):
-                wn.options.reaction.wall_coeff = opts.global_wall_coeff
-            if hasattr(wn.options.reaction, 'limiting_potential'):
-                wn.options.reaction.limiting_potential = opts.limiting_concentration
-            if hasattr(wn.options.reaction, 'roughness_correlation'):
-                wn.options.reaction.roughness_correlation = opts.roughness_correlation
-            
-            # Times
-            if hasattr(wn.options.time, 'duration'):
-                wn.options.time.duration = opts.duration
-            if hasattr(wn.options.time, 'hydraulic_timestep'):
-                wn.options.time.hydraulic_timestep = opts.hydraulic_timestep
-            if hasattr(wn.options.time, 'quality_timestep'):
-                wn.options.time.quality_timestep = opts.quality_timestep
-            if hasattr(wn.options.time, 'pattern_timestep'):
-                wn.options.time.pattern_timestep = opts.pattern_timestep
-            if hasattr(wn.options.time, 'pattern_start'):
-                wn.options.time.pattern_start = opts.pattern_start
-            if hasattr(wn.options.time, 'report_timestep'):
-                wn.options.time.report_timestep = opts.report_timestep
-            if hasattr(wn.options.time, 'report_start'):
-                wn.options.time.report_start = opts.report_start
-            
-            # Energy
-            if hasattr(wn.options.energy, 'global_efficiency') and opts.global_efficiency is not None:
-                wn.options.energy.global_efficiency = opts.global_efficiency
-            if hasattr(wn.options.energy, 'global_price') and opts.global_price is not None:
-                wn.options.energy.global_price = opts.global_price
-            if hasattr(wn.options.energy, 'demand_charge') and opts.demand_charge is not None:
-                wn.options.energy.demand_charge = opts.demand_charge
- 
-        # Patterns
+            parameter = _QUALITY_NAME.get(opts.quality_type)
+            if parameter is not None and hasattr(quality, 'parameter'):
+                quality.parameter = parameter
+            
+            # Plain values: hydraulics, quality, reactions, times, energy
+            for section_name, fields in _OPTION_SYNC_FIELDS:
+                section = getattr(wn.options, section_name)
+                for attr, field in fields:
+                    value = getattr(opts, field, None)
+                    if value is not None and hasattr(section, attr):
+                        setattr(section, attr, value)
+            
+            self._synced_options = state
+    
+    def _sync_patterns(self, wn) -> None:
+        """Update or add time patterns in the WNTR model."""
         if hasattr(wn, 'add_pattern'):
             # Instead of removing all patterns (which might fail if used), update existing ones or add new ones
             # First, we can try to remove patterns that are NOT in our local network to keep it clean,
             # but that's risky if we don't track everything. 
             # Safer approach: Update/Add what we have.
             
+            registry = getattr(wn, 'patterns', None)
+            if not hasattr(registry, 'get'):
+                registry = None
+            
+            synced = self._synced_patterns
             for pat in self.network.patterns.values():
-                if hasattr(wn, 'get_pattern'):
-                    try:
-                        wn_pat = wn.get_pattern(pat.id)
+                # Unchanged multipliers are not copied into WNTR again
+                if synced.get(pat.id) == pat.multipliers:
+                    continue
+                if registry is not None:
+                    wn_pat = registry.get(pat.id)
+                    if wn_pat is not None:
                         # Update existing pattern
                         wn_pat.multipliers = pat.multipliers
-                    except:
+                    else:
                         # Pattern doesn't exist, add it
                         wn.add_pattern(pat.id, pat.multipliers)
                 else:
-                    # Fallback for older WNTR versions or if get_pattern is not available
-                    # Try adding, if fails, assume it exists (but we can't easily update without get_pattern)
+                    # Fallback for older WNTR versions without a pattern registry
+                    # Try adding, if fails, assume it exists (but we can't easily update it)
                     try:
                         wn.add_pattern(pat.id, pat.multipliers)
-                    except:
-                        pass # Can't update, ignore
- 
-        # Curves
+                    except ValueError:
+                        pass # Already exists; can't update, ignore
+                synced[pat.id] = list(pat.multipliers)
+    
+    def _sync_curves(self, wn, converter) -> None:
+        """Update or add curves in the WNTR model (points converted to SI)."""
         if hasattr(wn, 'add_curve'):
-            from models.curve import CurveType
+            factors = _curve_factors(converter, True)
+            registry = getattr(wn, 'curves', None)
+            if not hasattr(registry, 'get'):
+                registry = None
+            
             for curve in self.network.curves.values():
-                points = []
-                for x, y in curve.points:
-                    new_x, new_y = x, y
-                    if curve.curve_type == CurveType.VOLUME:
-                        new_x = converter.length_to_si(x)
-                        vol_factor = 35.3147 if converter.system == UnitSystem.US else 1.0
-                        new_y = y / vol_factor
-                    elif curve.curve_type == CurveType.PUMP:
-                        new_x = converter.flow_to_si(x)
-                        new_y = converter.length_to_si(y) # Head
-                    elif curve.curve_type == CurveType.EFFICIENCY:
-                        new_x = converter.flow_to_si(x)
-                        # Y is efficiency %
-                    elif curve.curve_type == CurveType.HEADLOSS:
-                        new_x = converter.flow_to_si(x)
-                        new_y = converter.length_to_si(y) # Headloss
-                        
-                    points.append((new_x, new_y))
+                points = _scale_curve_points(curve.points, factors.get(curve.curve_type))
                 
-                if hasattr(wn, 'get_curve'):
-                    try:
-                        wn_curve = wn.get_curve(curve.id)
+                if registry is not None:
+                    wn_curve = registry.get(curve.id)
+                    if wn_curve is not None:
                         # Update existing curve
                         wn_curve.points = points
-                    except:
+                    else:
                         # Curve doesn't exist, add it
-                        wn.add_curve(curve.id, curve.curve_type.name, points)
+                        wn.add_curve(curve.id, _CURVE_TYPE_NAME[curve.curve_type], points)
                 else:
                     try:
-                        wn.add_curve(curve.id, curve.curve_type.name, points)
-                    except:
+                        wn.add_curve(curve.id, _CURVE_TYPE_NAME[curve.curve_type], points)
+                    except ValueError:
                         pass
-                 
-        # Labels (WNTR supports labels?)
-        # WNTR 0.4+ has labels support usually in wn.labels
-        # But write_inpfile might not support writing them if they are not standard objects
-        # WNTR stores labels as tuples (x, y, text, anchor_node) in a list or dict
-        # Let's check if we can add them.
-        # If not, we skip labels for now as they are visual only.
-        pass
+    
+    def _sync_controls(self, wn) -> None:
+        """Apply only the added/removed simple controls to the WNTR model.
+        
+        Controls are keyed by their EPANET text, so an edited control is a
+        removal plus an addition. Controls WNTR cannot parse are left out of
+        the model and written as text by export_network instead.
+        """
+        from wntr.epanet.io import _read_control_line
+        from wntr.epanet.util import FlowUnits as WNTRFlowUnits
+        
+        current = {control.to_string() for control in self.network.controls}
+        current.discard("")
+        
+        for text in self._synced_controls - current:
+            if text in wn.control_name_list:
+                wn.remove_control(text)
+            self._synced_controls.discard(text)
+            
+        flow_units = WNTRFlowUnits[self.network.options.flow_units.name]
+        for text in current - self._synced_controls:
+            try:
+                control_obj = _read_control_line(text, wn, flow_units, text)
+            except (KeyError, ValueError, IndexError, RuntimeError):
+                continue
+            if control_obj is not None:
+                wn.add_control(text, control_obj)
+                self._synced_controls.add(text)
     
     def close_project(self) -> None:
         """Close current project."""
         self.engine.close_project()
         self.network.clear()
+        self._next_id.clear()
+        self._reset_sync_state()
         self.filename = ""
         self.modified = False
         self._has_results = False
@@ -608,11 +1227,9 @@ class EPANETProject:
             if progress_callback:
                 progress_callback(10)
             
-            # Sync internal model to WNTR before running
-            self._sync_network_to_wntr()
-            
             # Create a temporary INP file that INCLUDES controls/rules
             # This is necessary because _sync_network_to_wntr doesn't fully populate WNTR controls
+            # (export_network syncs the internal model to WNTR first)
             import tempfile
             import os
             from core.epanet_io import export_network
@@ -635,7 +1252,7 @@ class EPANETProject:
                 if os.path.exists(temp_inp):
                     try:
                         os.remove(temp_inp)
-                    except:
+                    except OSError:
                         pass
             
             if progress_callback:
@@ -655,40 +1272,44 @@ class EPANETProject:
             
     def _generate_report(self, success: bool, error_msg: str = "") -> None:
         """Generate a status report."""
-        import datetime
-        
-        lines = []
-        lines.append("EPANET 2.2 - PySide6 Simulation Report")
-        lines.append("======================================")
-        lines.append(f"Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Project: {self.filename or 'Untitled'}")
-        lines.append("")
-        
-        if success:
-            lines.append("Simulation Status: SUCCESSFUL")
-            lines.append("")
-            lines.append("Network Statistics:")
-            lines.append(f"  Nodes: {len(self.network.nodes)}")
-            lines.append(f"  Links: {len(self.network.links)}")
-            
-            if self.engine.results:
-                res = self.engine.results
-                lines.append("")
-                lines.append("Simulation Details:")
-                # lines.append(f"  Duration: {res.time[-1] / 3600.0:.2f} hours") # WNTR results might not have simple time attribute like this directly accessible in all versions, checking structure
-                # WNTR results: node (dict of DF), link (dict of DF), network_name, time (index)
-                if hasattr(res, 'node') and 'pressure' in res.node:
-                     times = res.node['pressure'].index
-                     duration = (times[-1] - times[0]) / 3600.0
-                     lines.append(f"  Duration: {duration:.2f} hours")
-                     lines.append(f"  Time Steps: {len(times)}")
-        else:
-            lines.append("Simulation Status: FAILED")
-            lines.append(f"Error: {error_msg}")
+        fields = {
+            'date': datetime.now(),
+            'project': self.filename or 'Untitled',
+        }
+        
+        if not success:
+            self.last_report = _REPORT_FAILED.format_map(dict(fields, error=error_msg))
+            return
             
-        self.last_report = "\n".join(lines)
-                
-
+        report = _REPORT_SUCCESS.format_map(dict(
+            fields,
+            n_nodes=len(self.network.nodes),
+            n_links=len(self.network.links)
+        ))
+        
+        # WNTR results: node (dict of DF), link (dict of DF), network_name, time (index)
+        res = self.engine.results
+        if res and hasattr(res, 'node') and 'pressure' in res.node:
+            times = res.node['pressure'].index
+            report += _REPORT_DETAILS.format(
+                duration=(times[-1] - times[0]) / 3600.0,
+                steps=len(times)
+            )
+            
+            # Reduce over the shared results buffer instead of copying the
+            # whole time x node table; only the two extremes are converted
+            pressure = self.get_results_view('pressure')
+            if pressure is not None and pressure.nbytes:
+                pressure = np.asarray(pressure)
+                flow_units = self.network.options.flow_units
+                converter = get_converter(flow_units)
+                report += _REPORT_PRESSURE.format(
+                    low=converter.pressure_to_project(float(pressure.min())),
+                    high=converter.pressure_to_project(float(pressure.max())),
+                    units=get_unit_label('pressure', flow_units)
+                )
+            
+        self.last_report = report
     
     def has_results(self) -> bool:
         return self._has_results
@@ -698,9 +1319,10 @@ class EPANETProject:
     
     def _load_network_from_wntr(self) -> None:
         """Convert WNTR network to our internal data model."""
-        from core.units import UnitConverter, UnitSystem
-        
         self.network.clear()
+        self._synced_controls = set()
+        self._reset_sync_state()
+        self._next_id.clear()
         wn = self.engine.wn
         if not wn:
             return
@@ -708,437 +1330,234 @@ class EPANETProject:
         # 1. Load Options FIRST to determine units
         if hasattr(wn, 'options'):
             opts = wn.options
+            hydraulic = opts.hydraulic
+            options = self.network.options
             
             # Hydraulics
             # Check for flow_units or inpfile_units (WNTR 1.x)
-            flow_units_val = getattr(opts.hydraulic, 'flow_units', None)
+            flow_units_val = getattr(hydraulic, 'flow_units', None)
             if flow_units_val is None:
-                flow_units_val = getattr(opts.hydraulic, 'inpfile_units', None)
+                flow_units_val = getattr(hydraulic, 'inpfile_units', None)
                 
             if flow_units_val:
                 # Map WNTR flow units string to our Enum
                 # WNTR uses strings like 'LPS', 'GPM'
-                fu_str = str(flow_units_val).split()[0].upper() # Handle 'LPS' or 'LPS (Litres/sec)'
+                fu_str = str(flow_units_val).split(None, 1)[0].upper() # Handle 'LPS' or 'LPS (Litres/sec)'
                 
-                # Map string to FlowUnits enum
-                fu_map = {
-                    'CFS': FlowUnits.CFS,
-                    'GPM': FlowUnits.GPM,
-                    'MGD': FlowUnits.MGD,
-                    'IMGD': FlowUnits.IMGD,
-                    'AFD': FlowUnits.AFD,
-                    'LPS': FlowUnits.LPS,
-                    'LPM': FlowUnits.LPM,
-                    'MLD': FlowUnits.MLD,
-                    'CMH': FlowUnits.CMH,
-                    'CMD': FlowUnits.CMD
-                }
-                if fu_str in fu_map:
-                    self.network.options.flow_units = fu_map[fu_str]
-            
-            if hasattr(opts.hydraulic, 'headloss'):
-                headloss_str = str(opts.hydraulic.headloss).upper()
-                if 'H-W' in headloss_str or 'HW' in headloss_str:
-                    self.network.options.headloss_formula = HeadLossType.HW
-                elif 'D-W' in headloss_str or 'DW' in headloss_str:
-                    self.network.options.headloss_formula = HeadLossType.DW
-                elif 'C-M' in headloss_str or 'CM' in headloss_str:
-                    self.network.options.headloss_formula = HeadLossType.CM
-            
-            if hasattr(opts.hydraulic, 'viscosity'):
-                self.network.options.viscosity = opts.hydraulic.viscosity
-            if hasattr(opts.hydraulic, 'specific_gravity'):
-                self.network.options.specific_gravity = opts.hydraulic.specific_gravity
-            if hasattr(opts.hydraulic, 'trials'):
-                self.network.options.trials = opts.hydraulic.trials
-            if hasattr(opts.hydraulic, 'accuracy'):
-                self.network.options.accuracy = opts.hydraulic.accuracy
-            if hasattr(opts.hydraulic, 'unbalanced'):
-                self.network.options.unbalanced = str(opts.hydraulic.unbalanced).upper()
-            if hasattr(opts.hydraulic, 'demand_multiplier'):
-                self.network.options.demand_multiplier = opts.hydraulic.demand_multiplier
-            if hasattr(opts.hydraulic, 'emitter_exponent'):
-                self.network.options.emitter_exponent = opts.hydraulic.emitter_exponent
+                flow_units = _FLOW_UNITS_MAP.get(fu_str)
+                if flow_units is not None:
+                    options.flow_units = flow_units
+            
+            headloss = getattr(hydraulic, 'headloss', _MISSING)
+            if headloss is not _MISSING:
+                headloss_type = _HEADLOSS_MAP.get(str(headloss).upper().replace('-', ''))
+                if headloss_type is not None:
+                    options.headloss_formula = headloss_type
             
             # Quality
-            if hasattr(opts.quality, 'parameter'):
-                qual_str = str(opts.quality.parameter).upper()
-                if 'NONE' in qual_str:
-                    self.network.options.quality_type = QualityType.NONE
-                elif 'CHEMICAL' in qual_str or 'CHEM' in qual_str:
-                    self.network.options.quality_type = QualityType.CHEM
-                    # Extract chemical name and units if available
-                    parts = str(opts.quality.parameter).split()
-                    if len(parts) > 1:
-                        self.network.options.chemical_name = parts[1]
-                        if len(parts) > 2:
-                            self.network.options.chemical_units = parts[2]
-                elif 'AGE' in qual_str:
-                    self.network.options.quality_type = QualityType.AGE
-                elif 'TRACE' in qual_str:
-                    self.network.options.quality_type = QualityType.TRACE
-                    parts = str(opts.quality.parameter).split()
-                    if len(parts) > 1:
-                        self.network.options.trace_node = parts[1]
-            
-            if hasattr(opts.quality, 'diffusivity'):
-                self.network.options.diffusivity = opts.quality.diffusivity
-            if hasattr(opts.quality, 'tolerance'):
-                self.network.options.quality_tolerance = opts.quality.tolerance
-            
-            # Reactions
-            if hasattr(opts.reaction, 'bulk_order'):
-                self.network.options.bulk_order = opts.reaction.bulk_order
-            if hasattr(opts.reaction, 'wall_order'):
-                self.network.options.wall_order = opts.reaction.wall_order
-            if hasattr(opts.reaction, 'bulk_coeff'):
-                self.network.options.global_bulk_coeff = opts.reaction.bulk_coeff
-            if hasattr(opts.reaction, 'wall_coeff'):
-                self.network.options.global_wall_coeff = opts.reaction.wall_coeff
-            if hasattr(opts.reaction, 'limiting_potential'):
-                self.network.options.limiting_concentration = opts.reaction.limiting_potential
-            if hasattr(opts.reaction, 'roughness_correlation'):
-                self.network.options.roughness_correlation = opts.reaction.roughness_correlation
-            
-            # Times
-            if hasattr(opts.time, 'duration'):
-                self.network.options.duration = int(opts.time.duration)
-            if hasattr(opts.time, 'hydraulic_timestep'):
-                self.network.options.hydraulic_timestep = int(opts.time.hydraulic_timestep)
-            if hasattr(opts.time, 'quality_timestep'):
-                self.network.options.quality_timestep = int(opts.time.quality_timestep)
-            if hasattr(opts.time, 'pattern_timestep'):
-                self.network.options.pattern_timestep = int(opts.time.pattern_timestep)
-            if hasattr(opts.time, 'pattern_start'):
-                self.network.options.pattern_start = int(opts.time.pattern_start)
-            if hasattr(opts.time, 'report_timestep'):
-                self.network.options.report_timestep = int(opts.time.report_timestep)
-            if hasattr(opts.time, 'report_start'):
-                self.network.options.report_start = int(opts.time.report_start)
-            if hasattr(opts.time, 'statistic'):
-                self.network.options.statistic = str(opts.time.statistic).upper()
-            
-            # Energy
-            if hasattr(opts.energy, 'global_efficiency'):
-                self.network.options.global_efficiency = opts.energy.global_efficiency
-            if hasattr(opts.energy, 'global_price'):
-                self.network.options.global_price = opts.energy.global_price
-            if hasattr(opts.energy, 'demand_charge'):
-                self.network.options.demand_charge = opts.energy.demand_charge
+            parameter = getattr(opts.quality, 'parameter', _MISSING)
+            if parameter is not _MISSING:
+                parts = str(parameter).split()
+                quality_type = _QUALITY_MAP.get(parts[0].upper()) if parts else None
+                if quality_type is not None:
+                    options.quality_type = quality_type
+                    if quality_type == QualityType.CHEM:
+                        # Extract chemical name and units if available
+                        if len(parts) > 1:
+                            options.chemical_name = parts[1]
+                            if len(parts) > 2:
+                                options.chemical_units = parts[2]
+                    elif quality_type == QualityType.TRACE:
+                        if len(parts) > 1:
+                            options.trace_node = parts[1]
+            
+            # Plain per-section values
+            for section_name, fields in _OPTION_LOAD_FIELDS:
+                section = getattr(opts, section_name)
+                for attr, field, cast in fields:
+                    value = getattr(section, attr, _MISSING)
+                    if value is not _MISSING:
+                        setattr(options, field, cast(value) if cast else value)
         
         # Initialize Unit Converter
-        converter = UnitConverter(self.network.options.flow_units)
+        converter = get_converter(self.network.options.flow_units)
             
         # Project Info
-        if hasattr(wn, 'title'):
-            self.network.title = wn.title
+        title = getattr(wn, 'title', _MISSING)
+        if title is not _MISSING:
+            self.network.title = title
             
         # Nodes
-        for name, node in wn.nodes():
-            x, y = node.coordinates
-            elevation = getattr(node, 'elevation', 0.0)
+        # Elevation (m -> ft if US) converted as one column
+        nodes = list(wn.nodes())
+        elevations = np.fromiter((getattr(node, 'elevation', 0.0) for _, node in nodes),
+                                 dtype=np.float64, count=len(nodes))
+        elevations = converter.length_to_project(elevations).tolist()
+        
+        new_nodes = []
+        for (name, node), elevation in zip(nodes, elevations):
+            builder = _class_builder(_NODE_BUILDERS, type(node))
+            if builder is None:
+                continue
             
-            # Convert Elevation (m -> ft if US)
-            elevation = converter.length_to_project(elevation)
+            x, y = node.coordinates
             
-            if isinstance(node, wntr.network.Junction):
-                # Base Demand is flow (CMS -> Project Flow Units)
-                # Note: WNTR base_demand is usually in CMS
-                base_demand = converter.flow_to_project(node.base_demand)
-                
-                new_node = Junction(
-                    id=name,
-                    x=x, y=y,
-                    elevation=elevation,
-                    base_demand=base_demand
-                )
-                if hasattr(node, 'demand_pattern_name'):
-                    new_node.demand_pattern = node.demand_pattern_name
-            elif isinstance(node, wntr.network.Reservoir):
-                # Reservoir Head is Length (m -> ft if US)
-                base_head = getattr(node, 'base_head', 0.0)
-                # If using pattern, base_head might be 0 or mean something else
-                total_head = converter.length_to_project(base_head)
-                
-                new_node = Reservoir(
-                    id=name,
-                    x=x, y=y,
-                    elevation=0.0, # Reservoirs don't have elevation property in EPANET GUI usually, just Total Head
-                    total_head=total_head
-                )
-                if hasattr(node, 'head_pattern_name'):
-                    new_node.head_pattern = node.head_pattern_name
-            elif isinstance(node, wntr.network.Tank):
-                # Tank Levels are Length (m -> ft)
-                # Tank Diameter is Diameter (m -> in/mm)
-                
-                init_level = converter.length_to_project(node.init_level)
-                min_level = converter.length_to_project(node.min_level)
-                max_level = converter.length_to_project(node.max_level)
-                min_vol = node.min_vol # Volume is usually m3. Need volume conversion? 
-                
-                vol_factor = 35.3147 if converter.system == UnitSystem.US else 1.0
-                min_vol = min_vol * vol_factor
-                
-                diameter = converter.diameter_to_project(node.diameter)
-                
-                new_node = Tank(
-                    id=name,
-                    x=x, y=y,
-                    elevation=elevation,
-                    init_level=init_level,
-                    min_level=min_level,
-                    max_level=max_level,
-                    diameter=diameter,
-                    min_volume=min_vol,
-                    volume_curve=getattr(node, 'vol_curve_name', None)
-                )
-                
-                # Mixing Model
-                if hasattr(node, 'mixing_model'):
-                    mix_str = str(node.mixing_model).upper()
-                    mix_map = {
-                        'MIXED': MixingModel.MIX1,
-                        '2COMP': MixingModel.MIX2,
-                        'FIFO': MixingModel.FIFO,
-                        'LIFO': MixingModel.LIFO
-                    }
-                    new_node.mixing_model = mix_map.get(mix_str, MixingModel.MIX1)
-                if hasattr(node, 'mixing_fraction'):
-                    new_node.mixing_fraction = node.mixing_fraction
-                if hasattr(node, 'bulk_reaction_coefficient'):
-                    new_node.bulk_coeff = node.bulk_reaction_coefficient
-            else:
-                continue
+            new_node = builder(intern(name), node, converter, x, y, elevation)
                 
             # Common Node properties
-            if hasattr(node, 'emitter_coefficient'):
-                new_node.emitter_coeff = node.emitter_coefficient
-            if hasattr(node, 'initial_quality'):
-                new_node.init_quality = node.initial_quality
-            if hasattr(node, 'tag'):
-                new_node.tag = node.tag
+            value = getattr(node, 'emitter_coefficient', _MISSING)
+            if value is not _MISSING:
+                new_node.emitter_coeff = value
+            value = getattr(node, 'initial_quality', _MISSING)
+            if value is not _MISSING:
+                new_node.init_quality = value
+            value = getattr(node, 'tag', _MISSING)
+            if value is not _MISSING:
+                new_node.tag = value
                 
-            self.network.add_node(new_node)
+            new_nodes.append(new_node)
+            
+        self.network.add_nodes_bulk(new_nodes)
             
         # Update map bounds from WNTR options if available
-        if hasattr(wn, 'options') and hasattr(wn.options, 'graphics') and hasattr(wn.options.graphics, 'map_extent'):
-            extent = wn.options.graphics.map_extent
-            if extent:
-                try:
-                    if len(extent) == 4:
-                        self.network.map_bounds['min_x'] = float(extent[0])
-                        self.network.map_bounds['min_y'] = float(extent[1])
-                        self.network.map_bounds['max_x'] = float(extent[2])
-                        self.network.map_bounds['max_y'] = float(extent[3])
-                except:
-                    pass
+        graphics = getattr(getattr(wn, 'options', None), 'graphics', None)
+        extent = getattr(graphics, 'map_extent', None)
+        if extent:
+            # Convert all four values before touching the bounds, so a bad
+            # extent leaves them unchanged instead of half updated
+            try:
+                bounds = tuple(map(float, extent))
+            except (TypeError, ValueError):
+                bounds = ()
+            if len(bounds) == 4:
+                self.network.map_bounds.update(zip(('min_x', 'min_y', 'max_x', 'max_y'), bounds))
             
         # Links
-        for name, link in wn.links():
-            from_node = link.start_node_name
-            to_node = link.end_node_name
-            
-            if isinstance(link, wntr.network.Pipe):
-                # Length: m -> ft
-                length = converter.length_to_project(link.length)
-                # Diameter: m -> in/mm
-                diameter = converter.diameter_to_project(link.diameter)
-                
-                new_link = Pipe(
-                    id=name,
-                    from_node=from_node,
-                    to_node=to_node,
-                    length=length,
-                    diameter=diameter,
-                    roughness=link.roughness
-                )
-                if hasattr(link, 'minor_loss'):
-                    new_link.minor_loss = link.minor_loss
-                if hasattr(link, 'bulk_reaction_coefficient'):
-                    new_link.bulk_coeff = link.bulk_reaction_coefficient
-                if hasattr(link, 'wall_reaction_coefficient'):
-                    new_link.wall_coeff = link.wall_reaction_coefficient
-                    
-            elif isinstance(link, wntr.network.Pump):
-                new_link = Pump(
-                    id=name,
-                    from_node=from_node,
-                    to_node=to_node
-                )
-                if hasattr(link, 'pump_curve_name'):
-                    new_link.pump_curve = link.pump_curve_name
-                if hasattr(link, 'power'):
-                    # Power units? HP (US) or kW (SI)
-                    power = link.power
-                    if converter.system == UnitSystem.US:
-                        power = power / 745.7
-                    else:
-                        power = power / 1000.0
-                    new_link.power = power
-                    
-                if hasattr(link, 'speed_pattern_name'):
-                    new_link.speed_pattern = link.speed_pattern_name
-                    
-            elif isinstance(link, wntr.network.Valve):
-                # Diameter: m -> in/mm
-                diameter = converter.diameter_to_project(link.diameter)
-                
-                new_link = Valve(
-                    id=name,
-                    valve_type=LinkType.PRV, # Default, need to check type
-                    from_node=from_node,
-                    to_node=to_node,
-                    diameter=diameter
-                )
-                # Map valve type
-                if hasattr(link, 'valve_type'):
-                    vt = str(link.valve_type).upper()
-                    if vt == 'PRV': new_link.link_type = LinkType.PRV
-                    elif vt == 'PSV': new_link.link_type = LinkType.PSV
-                    elif vt == 'PBV': new_link.link_type = LinkType.PBV
-                    elif vt == 'FCV': new_link.link_type = LinkType.FCV
-                    elif vt == 'TCV': new_link.link_type = LinkType.TCV
-                    elif vt == 'GPV': new_link.link_type = LinkType.GPV
-                
-                if hasattr(link, 'setting'):
-                    setting = link.setting
-                    if new_link.link_type in [LinkType.PRV, LinkType.PSV, LinkType.PBV]:
-                        setting = converter.pressure_to_project(setting)
-                    elif new_link.link_type == LinkType.FCV:
-                        setting = converter.flow_to_project(setting)
-                    
-                    new_link.valve_setting = setting
-                    
-                if hasattr(link, 'minor_loss'):
-                    new_link.minor_loss = link.minor_loss
-            else:
+        # Length (m -> ft) and diameter (m -> in/mm) converted as whole columns
+        links = list(wn.links())
+        lengths = np.fromiter((getattr(link, 'length', np.nan) for _, link in links),
+                              dtype=np.float64, count=len(links))
+        diameters = np.fromiter((getattr(link, 'diameter', np.nan) for _, link in links),
+                                dtype=np.float64, count=len(links))
+        lengths = converter.length_to_project(lengths).tolist()
+        diameters = converter.diameter_to_project(diameters).tolist()
+        
+        new_links = []
+        for (name, link), length, diameter in zip(links, lengths, diameters):
+            builder = _class_builder(_LINK_BUILDERS, type(link))
+            if builder is None:
                 continue
+            new_link = builder(name, link, converter, length, diameter)
             
             # Common Link properties
-            if hasattr(link, 'tag'):
-                new_link.tag = link.tag
-            if hasattr(link, 'status'):
+            value = getattr(link, 'tag', _MISSING)
+            if value is not _MISSING:
+                new_link.tag = value
+            status = getattr(link, 'status', _MISSING)
+            if status is not _MISSING:
                 # Map status
-                st = str(link.status).upper()
-                if st == 'OPEN': new_link.status = LinkStatus.OPEN
-                elif st == 'CLOSED': new_link.status = LinkStatus.CLOSED
-                elif st == 'CV': new_link.status = LinkStatus.CV
+                st = _wntr_key(status)
+                new_link.status = _STATUS_MAP.get(st, new_link.status)
                 
-            self.network.add_link(new_link)
+            new_links.append(new_link)
+            
+        self.network.add_links_bulk(new_links)
             
         # Patterns
         if hasattr(wn, 'patterns'):
-            from models.pattern import Pattern
             for name, pat in wn.patterns():
                 new_pat = Pattern(id=name)
-                new_pat.multipliers = list(pat.multipliers)
+                new_pat.multipliers = np.asarray(pat.multipliers, dtype=np.float64).tolist()
                 self.network.patterns[name] = new_pat
                 
         # Curves
         if hasattr(wn, 'curves'):
-            from models.curve import Curve, CurveType
+            curve_factors = _curve_factors(converter, False)
             for name, curve in wn.curves():
                 new_curve = Curve(id=name)
                 # Curve points (X, Y) need conversion depending on type?
                 
-                ct = str(curve.curve_type).upper()
-                if ct == 'VOLUME': new_curve.curve_type = CurveType.VOLUME
-                elif ct == 'PUMP': new_curve.curve_type = CurveType.PUMP
-                elif ct == 'EFFICIENCY': new_curve.curve_type = CurveType.EFFICIENCY
-                elif ct == 'HEADLOSS': new_curve.curve_type = CurveType.HEADLOSS
-                else: new_curve.curve_type = CurveType.GENERIC
+                ct = _wntr_key(curve.curve_type)
+                new_curve.curve_type = _CURVE_TYPE_MAP.get(ct, CurveType.GENERIC)
                 
-                points = []
-                for x, y in curve.points:
-                    new_x, new_y = x, y
-                    if new_curve.curve_type == CurveType.VOLUME:
-                        new_x = converter.length_to_project(x)
-                        vol_factor = 35.3147 if converter.system == UnitSystem.US else 1.0
-                        new_y = y * vol_factor
-                    elif new_curve.curve_type == CurveType.PUMP:
-                        new_x = converter.flow_to_project(x)
-                        new_y = converter.length_to_project(y) # Head
-                    elif new_curve.curve_type == CurveType.EFFICIENCY:
-                        new_x = converter.flow_to_project(x)
-                        # Y is efficiency %
-                    elif new_curve.curve_type == CurveType.HEADLOSS:
-                        new_x = converter.flow_to_project(x)
-                        new_y = converter.length_to_project(y) # Headloss
-                        
-                    points.append((new_x, new_y))
-                    
-                new_curve.points = points
+                new_curve.points = _scale_curve_points(curve.points, curve_factors.get(new_curve.curve_type))
                 self.network.curves[name] = new_curve
 
         # Controls
         if hasattr(wn, 'controls'):
-            for name, control in wn.controls():
-                # Convert WNTR control to string and then to SimpleControl
-                control_str = str(control)
-                simple_control = SimpleControl.from_string(control_str)
-                if simple_control:
-                    self.network.controls.append(simple_control)
+            for name, control in list(wn.controls()):
+                # Read the WNTR control directly (rules are skipped here)
+                simple_control = SimpleControl.from_wntr(control, self.network.options.flow_units)
+                if simple_control is None:
+                    continue
+                text = simple_control.to_string()
+                if text in self._synced_controls:
+                    # Exact duplicate; leave it in the model under its own name
+                    continue
+                # Re-key under its EPANET text so _sync_controls can diff it
+                wn.remove_control(name)
+                wn.add_control(text, control)
+                self._synced_controls.add(text)
+                self.network.controls.append(simple_control)
                     
-        # Rules
-        if hasattr(wn, 'rules'):
-            for name, rule in wn.rules():
-                # Convert WNTR rule to string and then to Rule
-                rule_str = str(rule)
-                rule_obj = Rule.from_string(rule_str)
-                if rule_obj:
-                    self.network.rules.append(rule_obj)
+        # Rules: WNTR keeps them in wn.controls() (there is no wn.rules() in
+        # the supported WNTR releases), so from_wntr skips them above and they
+        # stay in the WNTR model, which writes them back to [RULES] itself
+
+        # The loaded controls were parsed with the file's units, so a units
+        # change before the first sync must still re-parse them
+        self._synced_units = self.network.options.flow_units
             
     def _load_results_from_engine(self) -> None:
         """Load results into network objects."""
-        from core.units import UnitConverter
-        
         # Initialize Unit Converter
-        converter = UnitConverter(self.network.options.flow_units)
+        converter = get_converter(self.network.options.flow_units)
+        
+        # One lookup per result table, aligned to the network's own order and
+        # converted (SI -> Project) as whole columns
+        engine = self.engine
+        nodes = self.network.nodes
+        node_ids = list(nodes)
+        
+        # Demand: SI (CMS) -> Project Flow
+        demands = (engine.get_final_values('demand', node_ids) * converter.flow_scale).tolist()
+        # Head: SI (m) -> Project Length
+        heads = (engine.get_final_values('head', node_ids) * converter.length_scale).tolist()
+        # Pressure: SI (m) -> Project Pressure (psi or m)
+        pressures = (engine.get_final_values('pressure', node_ids) * converter.pressure_scale).tolist()
+        
+        # Quality: Units depend on type, usually Mass/L. 
+        # WNTR returns kg/m3 = mg/L?
+        # EPANET usually uses mg/L. 1 kg/m3 = 1000 mg / 1000 L = 1 mg/L.
+        # So SI (kg/m3) is numerically equivalent to mg/L.
+        # If Trace, it's percentage.
+        # If Age, it's hours. WNTR returns seconds for Age?
+        # Let's assume WNTR returns consistent units.
+        # For Age, WNTR returns seconds. EPANET GUI usually displays hours.
+        qualities = engine.get_final_values('quality', node_ids)
+        if self.network.options.quality_type == QualityType.AGE:
+            qualities = qualities / 3600.0 # Seconds -> Hours
+        qualities = qualities.tolist()
         
         # Nodes
-        for node_id, node in self.network.nodes.items():
-            # Demand: SI (CMS) -> Project Flow
-            demand_si = self.engine.get_node_result(node_id, NodeParam.DEMAND)
-            if demand_si is not None:
-                node.demand = converter.flow_to_project(demand_si)
-                
-            # Head: SI (m) -> Project Length
-            head_si = self.engine.get_node_result(node_id, NodeParam.HEAD)
-            if head_si is not None:
-                node.head = converter.length_to_project(head_si)
-                
-            # Pressure: SI (m) -> Project Pressure (psi or m)
-            pressure_si = self.engine.get_node_result(node_id, NodeParam.PRESSURE)
-            if pressure_si is not None:
-                node.pressure = converter.pressure_to_project(pressure_si)
-                
-            # Quality: Units depend on type, usually Mass/L. 
-            # WNTR returns kg/m3 = mg/L?
-            # EPANET usually uses mg/L. 1 kg/m3 = 1000 mg / 1000 L = 1 mg/L.
-            # So SI (kg/m3) is numerically equivalent to mg/L.
-            # If Trace, it's percentage.
-            # If Age, it's hours. WNTR returns seconds for Age?
-            # Let's assume WNTR returns consistent units.
-            # For Age, WNTR returns seconds. EPANET GUI usually displays hours.
-            quality_val = self.engine.get_node_result(node_id, NodeParam.QUALITY)
-            if quality_val is not None:
-                if self.network.options.quality_type == QualityType.AGE:
-                    node.quality = quality_val / 3600.0 # Seconds -> Hours
-                else:
-                    node.quality = quality_val
+        for node, demand, head, pressure, quality in zip(nodes.values(), demands, heads,
+                                                         pressures, qualities):
+            node.demand = demand
+            node.head = head
+            node.pressure = pressure
+            node.quality = quality
             
         # Links
-        for link_id, link in self.network.links.items():
-            # Flow: SI (CMS) -> Project Flow
-            flow_si = self.engine.get_link_result(link_id, LinkParam.FLOW)
-            if flow_si is not None:
-                link.flow = converter.flow_to_project(flow_si)
-                
-            # Velocity: SI (m/s) -> Project Velocity (ft/s or m/s)
-            vel_si = self.engine.get_link_result(link_id, LinkParam.VELOCITY)
-            if vel_si is not None:
-                link.velocity = converter.velocity_to_project(vel_si)
+        links = self.network.links
+        link_ids = list(links)
+        # Flow: SI (CMS) -> Project Flow
+        flows = (engine.get_final_values('flowrate', link_ids, 'link') * converter.flow_scale).tolist()
+        # Velocity: SI (m/s) -> Project Velocity (ft/s or m/s)
+        velocities = (engine.get_final_values('velocity', link_ids, 'link') * converter.velocity_scale).tolist()
+        headlosses = engine.get_final_values('headloss', link_ids, 'link').tolist()
+        for link, flow, velocity, headloss in zip(links.values(), flows, velocities, headlosses):
+            link.flow = flow
+            link.velocity = velocity
                 
             # Headloss: SI (m/km) -> Project Headloss (ft/kft or m/km)
             # WNTR results for headloss are usually "Headloss per 1000 units of length"
@@ -1161,7 +1580,7 @@ class EPANETProject:
             # So no conversion needed if it's strictly slope * 1000.
             # UNLESS WNTR returns total headloss (m).
             # Let's assume it returns Unit Headloss (slope * 1000).
-            link.headloss = self.engine.get_link_result(link_id, LinkParam.HEADLOSS)
+            link.headloss = headloss
 
     def get_time_series(self, obj_type: str, obj_id: str, param: Any) -> Tuple[list, list]:
         """Get time series data."""
@@ -1175,6 +1594,10 @@ class EPANETProject:
         """Get values for all nodes at a specific time index."""
         return self.engine.get_network_values_at_time(param, time_index)
 
+    def get_results_view(self, attr: str, kind: str = 'node') -> Optional[memoryview]:
+        """Get a zero-copy view of a results table ('node' or 'link')."""
+        return self.engine.get_results_view(attr, kind)
+
     def get_pump_energy(self, pump_id: str) -> float:
         """Get pump energy usage."""
         return self.engine.get_pump_energy(pump_id)
@@ -1189,54 +1612,23 @@ class EPANETProject:
             Number of nodes updated
         """
         try:
-            # Read file content
-            with open(filename, 'r') as f:
-                lines = f.readlines()
-            
-            # Check if file has sections
-            has_sections = any(line.strip().startswith('[') for line in lines)
-            
-            coords = {}
-            in_coords_section = False
+            # Only the [COORDINATES] text is decoded (or all of a pure map file);
+            # blank and comment lines are left to the parser
+            coords = _parse_map_coords(_read_map_coordinate_text(filename).splitlines())
             
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith(';'):
-                    continue
-                
-                if line.startswith('['):
-                    if line.upper().startswith('[COORDINATES]'):
-                        in_coords_section = True
-                    else:
-                        in_coords_section = False
-                    continue
-                
-                # Parse coordinates if in section or if file has no sections (pure map file)
-                if in_coords_section or not has_sections:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        node_id = parts[0]
-                        try:
-                            x = float(parts[1])
-                            y = float(parts[2])
-                            coords[node_id] = (x, y)
-                        except ValueError:
-                            continue
-            
-            # Update network nodes
+            # Update network nodes and the WNTR model (if any) in one pass
+            nodes = self.network.nodes
+            wn_nodes = self.engine.wn.nodes if self.engine.wn else {}
             updated_count = 0
             for node_id, (x, y) in coords.items():
-                if node_id in self.network.nodes:
-                    node = self.network.nodes[node_id]
+                node = nodes.get(node_id)
+                if node is not None:
                     node.x = x
                     node.y = y
                     updated_count += 1
-                    
-            # Update WNTR model if exists
-            if self.engine.wn:
-                for node_id, (x, y) in coords.items():
-                    if node_id in self.engine.wn.nodes:
-                        self.engine.wn.nodes[node_id].coordinates = (x, y)
+                wn_node = wn_nodes.get(node_id)
+                if wn_node is not None:
+                    wn_node.coordinates = (x, y)
             
             self.modified = True
             return updated_count
@@ -1244,6 +1636,52 @@ class EPANETProject:
         except Exception as e:
             raise Exception(f"Failed to import map: {e}")
 
+    @property
+    def default_properties(self) -> Dict[str, Any]:
+        """Default property values for new objects (as entered, often strings).
+        
+        Assign a new dict to change defaults; the parsed numbers used by
+        add_node are cached until the next assignment.
+        """
+        return self._default_properties
+    
+    @default_properties.setter
+    def default_properties(self, value: Dict[str, Any]) -> None:
+        self._default_properties = value
+        self._node_defaults = {}
+    
+    @property
+    def id_increment(self) -> int:
+        """Number new IDs start counting from for each prefix.
+        
+        Assigning it restarts every prefix's counter, so the next added
+        object tries this number again.
+        """
+        return self._id_increment
+    
+    @id_increment.setter
+    def id_increment(self, value: int) -> None:
+        self._id_increment = value
+        self._next_id = {}
+    
+    def _node_default(self, key: str, fallback: float) -> float:
+        """Get a numeric default property, parsing it only on first use."""
+        value = self._node_defaults.get(key)
+        if value is None:
+            value = float(self._default_properties.get(key, fallback))
+            self._node_defaults[key] = value
+        return value
+
+    def generate_id(self, kind: str, prefix: str, existing, start: int) -> str:
+        """Return the next unused ID for a prefix."""
+        key = (kind, prefix)
+        n = self._next_id.get(key, start)
+        # Only scan forward on collision (e.g. IDs loaded from a file)
+        while f"{prefix}{n}" in existing:
+            n += 1
+        self._next_id[key] = n + 1
+        return f"{prefix}{n}"
+
     def add_node(self, node_type: str, x: float, y: float) -> str:
         """Add a new node to the project.
         
@@ -1257,34 +1695,25 @@ class EPANETProject:
         """
         # Generate ID
         prefix = self.default_prefixes.get(node_type, 'N')
-        increment = self.id_increment
+        node_id = self.generate_id('node', prefix, self.network.nodes, self.id_increment)
         
-        while True:
-            node_id = f"{prefix}{increment}"
-            if node_id not in self.network.nodes:
-                break
-            increment += 1
-            
-        # Update increment for next time
-        self.id_increment = increment + 1
-        
-        # Get defaults
-        defaults = self.default_properties
+        # Get defaults (parsed once per default_properties assignment)
+        default = self._node_default
         
         # Create node object
         if node_type == 'Junction':
-            elev = float(defaults.get('node_elevation', 0))
+            elev = default('node_elevation', 0)
             node = Junction(node_id, x, y, elevation=elev)
         elif node_type == 'Reservoir':
-            head = float(defaults.get('total_head', 0)) # Using total_head default if available, or 0
+            head = default('total_head', 0) # Using total_head default if available, or 0
             node = Reservoir(node_id, x, y, total_head=head)
         elif node_type == 'Tank':
-            elev = float(defaults.get('node_elevation', 0))
-            diam = float(defaults.get('tank_diameter', 50))
-            height = float(defaults.get('tank_height', 10))
-            level = float(defaults.get('init_level', 0))
-            min_level = float(defaults.get('min_level', 0))
-            max_level = float(defaults.get('max_level', 10))
+            elev = default('node_elevation', 0)
+            diam = default('tank_diameter', 50)
+            height = default('tank_height', 10)
+            level = default('init_level', 0)
+            min_level = default('min_level', 0)
+            max_level = default('max_level', 10)
             
             node = Tank(node_id, x, y, elevation=elev, diameter=diam, 
                        init_level=level, min_level=min_level, max_level=max_level)
@@ -1318,19 +1747,9 @@ class EPANETProject:
             The ID of the new link
         """
         # Generate ID
-        prefix = {
-            'Pipe': 'P',
-            'Pump': 'P', # Or PU?
-            'Valve': 'V'
-        }.get(link_type, 'L')
-        
-        increment = self.id_increment
-        while True:
-            link_id = f"{prefix}{increment}"
-            if link_id not in self.network.links:
-                break
-            increment += 1
-        self.id_increment = increment + 1
+        prefix = _LINK_ID_PREFIXES.get(link_type, 'L')
+        
+        link_id = self.generate_id('link', prefix, self.network.links, self.id_increment)
         
         # Get defaults
         defaults = self.network.options.defaults
@@ -1347,7 +1766,6 @@ class EPANETProject:
                 n1 = self.network.nodes.get(from_node)
                 n2 = self.network.nodes.get(to_node)
                 if n1 and n2:
-                    import math
                     # Calculate total length including vertices
                     points = [(n1.x, n1.y)]
                     if vertices:
@@ -1355,10 +1773,8 @@ class EPANETProject:
                     points.append((n2.x, n2.y))
                     
                     total_dist = 0.0
-                    for i in range(len(points) - 1):
-                        p1 = points[i]
-                        p2 = points[i+1]
-                        total_dist += math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
+                    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+                        total_dist += hypot(x2 - x1, y2 - y1)
                     length = total_dist
             
             link = Pipe(link_id, from_node, to_node, length=length, diameter=diam, roughness=rough)
@@ -1396,17 +1812,7 @@ class EPANETProject:
         """
         # Generate ID
         # Labels don't strictly need IDs in EPANET, but we use them for management
-        prefix = "Text"
-        increment = 1
-        
-        # Simple ID generation
-        while True:
-            label_id = f"{prefix}{increment}"
-            if not hasattr(self.network, 'labels') or label_id not in self.network.labels:
-                break
-            increment += 1
-            
-        from models import Label
+        label_id = self.generate_id('label', "Text", self.network.labels, 1)
         label = Label(label_id, x, y, text)
         
         self.network.add_label(label)
@@ -1427,30 +1833,21 @@ class EPANETProject:
         
     def delete_link(self, link_id: str) -> None:
         """Delete a link from the project."""
-        if link_id not in self.network.links:
-            return
-            
-        self.network.remove_link(link_id)
-        self.modified = True
+        if self.network.remove_link(link_id):
+            self.modified = True
         
     def delete_label(self, label_id: str) -> None:
         """Delete a label from the project."""
-        if not hasattr(self.network, 'labels') or label_id not in self.network.labels:
-            return
-            
-        self.network.remove_label(label_id)
-        self.modified = True
+        if self.network.remove_label(label_id):
+            self.modified = True
     def convert_units(self, from_units: FlowUnits, to_units: FlowUnits) -> None:
         """Convert all network data from one unit system to another."""
         if from_units == to_units:
             return
             
-        from core.units import UnitConverter, UnitSystem
-        from models.curve import CurveType
-        
         # Create converters
-        old_cv = UnitConverter(from_units)
-        new_cv = UnitConverter(to_units)
+        old_cv = get_converter(from_units)
+        new_cv = get_converter(to_units)
         
         # Check if length units changed (US <-> SI)
         length_changed = old_cv.system != new_cv.system
@@ -1568,7 +1965,7 @@ class EPANETProject:
                         link.power = val_kw
                         
             # Valves
-            elif link.link_type in [LinkType.PRV, LinkType.PSV, LinkType.PBV]:
+            elif link.link_type in _PRESSURE_VALVE_TYPES:
                 # Diameter (in/mm)
                 if length_changed and link.diameter is not None:
                     val_si = old_cv.diameter_to_si(link.diameter)
@@ -1591,35 +1988,25 @@ class EPANETProject:
                     link.valve_setting = new_cv.flow_to_project(val_si)
                     
         # 3. Curves
+        # Old -> new (x, y) factors per curve type; lengths and volumes only
+        # change with the unit system
+        flow_f = old_cv.flow_to_si(1.0) * new_cv.flow_to_project(1.0)
+        if length_changed:
+            len_f = old_cv.length_to_si(1.0) * new_cv.length_to_project(1.0)
+            # 1 m3 = 35.3147 ft3
+            vol_f = 1.0 / 35.3147 if old_cv.system == UnitSystem.US else 35.3147
+        else:
+            len_f = vol_f = 1.0
+        curve_factors = {
+            CurveType.VOLUME: (len_f, vol_f), # Height, Volume
+            CurveType.PUMP: (flow_f, len_f), # Flow, Head
+            CurveType.EFFICIENCY: (flow_f, 1.0), # Flow, Efficiency %
+            CurveType.HEADLOSS: (flow_f, len_f), # Flow, Headloss
+        }
         for curve in self.network.curves.values():
-            new_points = []
-            for x, y in curve.points:
-                nx, ny = x, y
-                
-                # X-Axis
-                if curve.curve_type == CurveType.VOLUME:
-                    # X is Height (Length)
-                    if length_changed: nx = new_cv.length_to_project(old_cv.length_to_si(x))
-                elif curve.curve_type in [CurveType.PUMP, CurveType.EFFICIENCY, CurveType.HEADLOSS]:
-                    # X is Flow
-                    nx = new_cv.flow_to_project(old_cv.flow_to_si(x))
-                    
-                # Y-Axis
-                if curve.curve_type == CurveType.VOLUME:
-                    # Y is Volume
-                    if length_changed:
-                        factor = 35.3147
-                        val_si = y / factor if old_cv.system == UnitSystem.US else y
-                        ny = val_si * factor if new_cv.system == UnitSystem.US else val_si
-                elif curve.curve_type == CurveType.PUMP:
-                    # Y is Head (Length)
-                    if length_changed: ny = new_cv.length_to_project(old_cv.length_to_si(y))
-                elif curve.curve_type == CurveType.HEADLOSS:
-                    # Y is Headloss (Length)
-                    if length_changed: ny = new_cv.length_to_project(old_cv.length_to_si(y))
-                    
-                new_points.append((nx, ny))
-            curve.points = new_points
+            factors = curve_factors.get(curve.curve_type)
+            if factors is not None:
+                curve.points = _scale_curve_points(curve.points, factors)
             
         # 4. Map Coordinates (if length changed)
         if length_changed:
@@ -1686,7 +2073,6 @@ class EPANETProject:
         # 6. Controls
         # Simple Controls: LINK x STATUS AT TIME t / IF NODE y [PRESSURE|LEVEL] > z
         # We need to parse and convert 'z' if it's PRESSURE or LEVEL
-        import re
         
         # Regex to find "PRESSURE|LEVEL [<>]=? value"
         # Note: EPANET controls are case insensitive
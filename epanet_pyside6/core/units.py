@@ -1,12 +1,32 @@
 """Unit conversion utilities for EPANET."""
 
 from enum import Enum
+from functools import lru_cache
 from core.constants import FlowUnits
 
 class UnitSystem(Enum):
     US = 0  # US Customary
     SI = 1  # Metric
 
+_US_FLOW_UNITS = frozenset({
+    FlowUnits.CFS, FlowUnits.GPM, FlowUnits.MGD,
+    FlowUnits.IMGD, FlowUnits.AFD
+})
+
+# Conversion factors from CMS (m3/s) to each flow unit
+_FLOW_FACTORS = {
+    FlowUnits.CFS: 35.3147,
+    FlowUnits.GPM: 15850.3,
+    FlowUnits.MGD: 22.8245,
+    FlowUnits.IMGD: 19.0053,
+    FlowUnits.AFD: 70.0456,
+    FlowUnits.LPS: 1000.0,
+    FlowUnits.LPM: 60000.0,
+    FlowUnits.MLD: 86.4,
+    FlowUnits.CMH: 3600.0,
+    FlowUnits.CMD: 86400.0
+}
+
 class UnitConverter:
     """Handles conversion between WNTR internal units (SI) and Project units."""
     
@@ -14,12 +34,20 @@ class UnitConverter:
         self.flow_units = flow_units
         self.system = self._get_unit_system(flow_units)
         
+        # SI -> Project multipliers, resolved once so hot loops can multiply
+        # inline instead of calling a method that branches on the system.
+        # The methods below are a single multiply/divide, so they broadcast
+        # over NumPy arrays (whole result columns) as well as floats.
+        us = self.system == UnitSystem.US
+        self.length_scale = 3.28084 if us else 1.0
+        self.diameter_scale = 39.3701 if us else 1000.0
+        self.pressure_scale = 1.4219702 if us else 1.0
+        self.velocity_scale = 3.28084 if us else 1.0
+        self.flow_scale = _FLOW_FACTORS.get(flow_units, 1.0)
+        
     def _get_unit_system(self, flow_units: FlowUnits) -> UnitSystem:
         """Determine unit system from flow units."""
-        if flow_units in [
-            FlowUnits.CFS, FlowUnits.GPM, FlowUnits.MGD, 
-            FlowUnits.IMGD, FlowUnits.AFD
-        ]:
+        if flow_units in _US_FLOW_UNITS:
             return UnitSystem.US
         return UnitSystem.SI
 
@@ -29,15 +57,11 @@ class UnitConverter:
     # SI: meters
     def length_to_project(self, value_si: float) -> float:
         """Convert length from SI (m) to Project units (ft or m)."""
-        if self.system == UnitSystem.US:
-            return value_si * 3.28084
-        return value_si
+        return value_si * self.length_scale
 
     def length_to_si(self, value_project: float) -> float:
         """Convert length from Project units (ft or m) to SI (m)."""
-        if self.system == UnitSystem.US:
-            return value_project / 3.28084
-        return value_project
+        return value_project / self.length_scale
 
     # Diameter
     # WNTR: meters
@@ -45,15 +69,11 @@ class UnitConverter:
     # SI: millimeters
     def diameter_to_project(self, value_si: float) -> float:
         """Convert diameter from SI (m) to Project units (in or mm)."""
-        if self.system == UnitSystem.US:
-            return value_si * 39.3701
-        return value_si * 1000.0
+        return value_si * self.diameter_scale
 
     def diameter_to_si(self, value_project: float) -> float:
         """Convert diameter from Project units (in or mm) to SI (m)."""
-        if self.system == UnitSystem.US:
-            return value_project / 39.3701
-        return value_project / 1000.0
+        return value_project / self.diameter_scale
 
     # Pressure
     # WNTR: meters (pressure head)
@@ -61,25 +81,13 @@ class UnitConverter:
     # SI: meters
     def pressure_to_project(self, value_si: float) -> float:
         """Convert pressure from SI (m) to Project units (psi or m)."""
-        if self.system == UnitSystem.US:
-            # 1 m = 1.42197 psi (assuming specific gravity = 1.0)
-            # Note: EPANET calculates pressure = (Head - Elev) * 0.433 * SG (for US)
-            # WNTR returns pressure in meters of head?
-            # Actually WNTR results.node['pressure'] is in meters of water for SI, and... ?
-            # Wait, WNTR documentation says:
-            # "Pressure is the fluid pressure at the node (m)."
-            # If WNTR normalizes everything to SI (meters), then:
-            # 1 m head = 1.4219702 psi (for water SG=1)
-            # Let's assume SG=1 for now as per standard WNTR behavior unless we access options.
-            # Ideally we should use specific gravity from options.
-            return value_si * 1.4219702
-        return value_si
+        # 1 m head = 1.4219702 psi (for water SG=1)
+        # Ideally we should use specific gravity from options.
+        return value_si * self.pressure_scale
 
     def pressure_to_si(self, value_project: float) -> float:
         """Convert pressure from Project units (psi or m) to SI (m)."""
-        if self.system == UnitSystem.US:
-            return value_project / 1.4219702
-        return value_project
+        return value_project / self.pressure_scale
 
     # Velocity
     # WNTR: m/s
@@ -87,85 +95,48 @@ class UnitConverter:
     # SI: m/s
     def velocity_to_project(self, value_si: float) -> float:
         """Convert velocity from SI (m/s) to Project units (fps or m/s)."""
-        if self.system == UnitSystem.US:
-            return value_si * 3.28084
-        return value_si
+        return value_si * self.velocity_scale
 
     def velocity_to_si(self, value_project: float) -> float:
         """Convert velocity from Project units (fps or m/s) to SI (m/s)."""
-        if self.system == UnitSystem.US:
-            return value_project / 3.28084
-        return value_project
+        return value_project / self.velocity_scale
         
     # Flow
     # WNTR: m³/s (CMS)
     # Project: Depends on FlowUnits
     def flow_to_project(self, value_si: float) -> float:
         """Convert flow from SI (CMS) to Project units."""
-        # Conversion factors from CMS (m3/s) to Target
-        factors = {
-            FlowUnits.CFS: 35.3147,
-            FlowUnits.GPM: 15850.3,
-            FlowUnits.MGD: 22.8245,
-            FlowUnits.IMGD: 19.0053,
-            FlowUnits.AFD: 70.0456,
-            FlowUnits.LPS: 1000.0,
-            FlowUnits.LPM: 60000.0,
-            FlowUnits.MLD: 86.4,
-            FlowUnits.CMH: 3600.0,
-            FlowUnits.CMD: 86400.0
-        }
-        return value_si * factors.get(self.flow_units, 1.0)
+        return value_si * self.flow_scale
 
     def flow_to_si(self, value_project: float) -> float:
         """Convert flow from Project units to SI (CMS)."""
-        factors = {
-            FlowUnits.CFS: 35.3147,
-            FlowUnits.GPM: 15850.3,
-            FlowUnits.MGD: 22.8245,
-            FlowUnits.IMGD: 19.0053,
-            FlowUnits.AFD: 70.0456,
-            FlowUnits.LPS: 1000.0,
-            FlowUnits.LPM: 60000.0,
-            FlowUnits.MLD: 86.4,
-            FlowUnits.CMH: 3600.0,
-            FlowUnits.CMD: 86400.0
-        }
-        return value_project / factors.get(self.flow_units, 1.0)
+        return value_project / self.flow_scale
+
+@lru_cache(maxsize=None)
+def get_converter(flow_units: FlowUnits) -> UnitConverter:
+    """Shared UnitConverter for a flow unit (one per FlowUnits member)."""
+    return UnitConverter(flow_units)
+
+# param_type -> (US label, SI label); flow/demand use the flow units name
+_UNIT_LABELS = {
+    "elevation": ("ft", "m"),
+    "head": ("ft", "m"),
+    "length": ("ft", "m"),
+    "level": ("ft", "m"),
+    "diameter": ("in", "mm"),
+    "pressure": ("psi", "m"),
+    "velocity": ("fps", "m/s"),
+    "volume": ("ft3", "m3"),
+    # Unit headloss: m/km or ft/kft
+    "headloss": ("ft/kft", "m/km"),
+}
 
 def get_unit_label(param_type: str, flow_units: FlowUnits) -> str:
     """Get unit label for a parameter type."""
-    # Determine system
-    is_si = flow_units not in [
-        FlowUnits.CFS, FlowUnits.GPM, FlowUnits.MGD, 
-        FlowUnits.IMGD, FlowUnits.AFD
-    ]
-    
-    if param_type in ["elevation", "head", "length", "level"]:
-        return "m" if is_si else "ft"
-        
-    elif param_type == "diameter":
-        return "mm" if is_si else "in"
-        
-    elif param_type == "pressure":
-        return "m" if is_si else "psi"
-        
-    elif param_type == "velocity":
-        return "m/s" if is_si else "fps"
-        
-    elif param_type in ["flow", "demand"]:
+    if param_type == "flow" or param_type == "demand":
         return flow_units.name if flow_units else ""
-        
-    elif param_type == "volume":
-        return "m3" if is_si else "ft3"
-        
-    elif param_type == "headloss":
-        # Unit headloss: m/km or ft/kft
-        return "m/km" if is_si else "ft/kft"
-        
-    elif param_type == "quality":
-        # This is tricky as it depends on QualityType options
-        # For now return generic or empty, or assume mg/L
-        return "" 
-        
-    return ""
+    labels = _UNIT_LABELS.get(param_type)
+    if labels is None:
+        # Includes quality, which depends on the QualityType options
+        return ""
+    return labels[flow_units not in _US_FLOW_UNITS]
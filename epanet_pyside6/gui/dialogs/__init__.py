@@ -1,10 +1,27 @@
 """GUI dialogs."""
 
-from .simulation_status import SimulationStatusDialog
-from .pattern_editor import PatternEditor
-from .curve_editor import CurveEditor
-from .analysis_options_dialog import AnalysisOptionsDialog
-from .find_object_dialog import FindObjectDialog
-from .backdrop_dialog import BackdropDialog
-
 __all__ = ['SimulationStatusDialog', 'PatternEditor', 'CurveEditor', 'AnalysisOptionsDialog', 'FindObjectDialog', 'BackdropDialog']
+
+def __getattr__(name):
+    # Dialogs are imported on first access, so importing any one dialog
+    # submodule does not pull in every other dialog with it. The imports
+    # stay literal so freezers such as PyInstaller still find them.
+    if name == 'SimulationStatusDialog':
+        from .simulation_status import SimulationStatusDialog as value
+    elif name == 'PatternEditor':
+        from .pattern_editor import PatternEditor as value
+    elif name == 'CurveEditor':
+        from .curve_editor import CurveEditor as value
+    elif name == 'AnalysisOptionsDialog':
+        from .analysis_options_dialog import AnalysisOptionsDialog as value
+    elif name == 'FindObjectDialog':
+        from .find_object_dialog import FindObjectDialog as value
+    elif name == 'BackdropDialog':
+        from .backdrop_dialog import BackdropDialog as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
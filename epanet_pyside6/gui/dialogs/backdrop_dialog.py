@@ -2,9 +2,9 @@
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-    QPushButton, QFileDialog, QGroupBox, QDialogButtonBox
+    QPushButton, QFileDialog, QGroupBox, QDialogButtonBox, QDoubleSpinBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 
 class BackdropDialog(QDialog):
     """Dialog for loading and aligning backdrop image."""
@@ -40,20 +40,20 @@ class BackdropDialog(QDialog):
         # Upper Left
         ul_layout = QHBoxLayout()
         ul_layout.addWidget(QLabel("Upper Left X:"))
-        self.ul_x = QLineEdit()
+        self.ul_x = self.create_coord_spin()
         ul_layout.addWidget(self.ul_x)
         ul_layout.addWidget(QLabel("Y:"))
-        self.ul_y = QLineEdit()
+        self.ul_y = self.create_coord_spin()
         ul_layout.addWidget(self.ul_y)
         coord_layout.addLayout(ul_layout)
         
         # Lower Right
         lr_layout = QHBoxLayout()
         lr_layout.addWidget(QLabel("Lower Right X:"))
-        self.lr_x = QLineEdit()
+        self.lr_x = self.create_coord_spin()
         lr_layout.addWidget(self.lr_x)
         lr_layout.addWidget(QLabel("Y:"))
-        self.lr_y = QLineEdit()
+        self.lr_y = self.create_coord_spin()
         lr_layout.addWidget(self.lr_y)
         coord_layout.addLayout(lr_layout)
         
@@ -65,6 +65,14 @@ class BackdropDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
         
+    def create_coord_spin(self) -> QDoubleSpinBox:
+        """Create an editor for one map coordinate."""
+        spin = QDoubleSpinBox()
+        spin.setRange(-1e9, 1e9)
+        spin.setDecimals(6)
+        return spin
+        
+    @Slot()
     def browse_file(self):
         filename, _ = QFileDialog.getOpenFileName(
             self, "Select Backdrop Image", "", 
@@ -76,20 +84,14 @@ class BackdropDialog(QDialog):
             
     def get_data(self):
         """Return (image_path, ul_x, ul_y, lr_x, lr_y)."""
-        try:
-            ul_x = float(self.ul_x.text()) if self.ul_x.text() else 0.0
-            ul_y = float(self.ul_y.text()) if self.ul_y.text() else 0.0
-            lr_x = float(self.lr_x.text()) if self.lr_x.text() else 0.0
-            lr_y = float(self.lr_y.text()) if self.lr_y.text() else 0.0
-            return self.image_path, ul_x, ul_y, lr_x, lr_y
-        except ValueError:
-            return self.image_path, 0.0, 0.0, 0.0, 0.0
+        return (self.image_path, self.ul_x.value(), self.ul_y.value(),
+                self.lr_x.value(), self.lr_y.value())
             
     def set_data(self, path, ul_x, ul_y, lr_x, lr_y):
         """Set initial data."""
         self.image_path = path
         self.file_edit.setText(path)
-        self.ul_x.setText(str(ul_x))
-        self.ul_y.setText(str(ul_y))
-        self.lr_x.setText(str(lr_x))
-        self.lr_y.setText(str(lr_y))
+        self.ul_x.setValue(float(ul_x))
+        self.ul_y.setValue(float(ul_y))
+        self.lr_x.setValue(float(lr_x))
+        self.lr_y.setValue(float(lr_y))
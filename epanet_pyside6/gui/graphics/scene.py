@@ -146,14 +146,13 @@ class NetworkScene(QGraphicsScene):
             item.setZValue(1)
             
         # Add Labels
-        if hasattr(network, 'labels'):
-            for label in network.labels.values():
-                item = LabelItem(label)
-                # Apply offset
-                x = label.x - self.offset_x
-                y = -(label.y - self.offset_y)
-                item.setPos(x, y)
-                self.addItem(item)
+        for label in network.labels.values():
+            item = LabelItem(label)
+            # Apply offset
+            x = label.x - self.offset_x
+            y = -(label.y - self.offset_y)
+            item.setPos(x, y)
+            self.addItem(item)
                 
         self.update_scene_rect()
         
@@ -213,10 +212,10 @@ class NetworkScene(QGraphicsScene):
 
     def add_label(self, label_id):
         """Add a specific label to the scene."""
-        if not hasattr(self.project.network, 'labels') or label_id not in self.project.network.labels:
+        label = self.project.network.labels.get(label_id)
+        if label is None:
             return
             
-        label = self.project.network.labels[label_id]
         item = LabelItem(label)
         # Apply offset
         x = label.x - self.offset_x
@@ -36,6 +36,11 @@ class MainWindow(QMainWindow):
         self.recent_file_actions = []
         self.load_recent_files()
         
+        # Dialogs built on first use and reused afterwards
+        self.about_dialog = None
+        self.analysis_options_dialog = None
+        self.backdrop_dialog = None
+        
         self.setup_ui()
         self.create_menus()
         self.create_toolbars()
@@ -542,9 +547,10 @@ class MainWindow(QMainWindow):
         
     def show_about(self) -> None:
         """Show about dialog."""
-        from gui.dialogs.about_dialog import AboutDialog
-        dialog = AboutDialog(self)
-        dialog.exec()
+        if self.about_dialog is None:
+            from gui.dialogs.about_dialog import AboutDialog
+            self.about_dialog = AboutDialog(self)
+        self.about_dialog.exec()
         
 
         
@@ -986,10 +992,7 @@ class MainWindow(QMainWindow):
         try:
             if category == "Patterns":
                 # Generate unique ID
-                i = 1
-                while str(i) in self.project.network.patterns:
-                    i += 1
-                new_id = str(i)
+                new_id = self.project.generate_id('pattern', '', self.project.network.patterns, 1)
                 
                 # Create new pattern
                 from models import Pattern
@@ -1001,10 +1004,7 @@ class MainWindow(QMainWindow):
                 
             elif category == "Curves":
                 # Generate unique ID
-                i = 1
-                while str(i) in self.project.network.curves:
-                    i += 1
-                new_id = str(i)
+                new_id = self.project.generate_id('curve', '', self.project.network.curves, 1)
                 
                 # Create new curve
                 from models import Curve
@@ -1873,10 +1873,13 @@ class MainWindow(QMainWindow):
 
     def show_analysis_options(self) -> None:
         """Show analysis options dialog."""
-        from gui.dialogs.analysis_options_dialog import AnalysisOptionsDialog
         from dataclasses import asdict
         
-        dialog = AnalysisOptionsDialog(self)
+        dialog = self.analysis_options_dialog
+        if dialog is None:
+            from gui.dialogs.analysis_options_dialog import AnalysisOptionsDialog
+            dialog = self.analysis_options_dialog = AnalysisOptionsDialog(self)
+            dialog.options_updated.connect(self.update_analysis_options)
         
         # Prepare options data
         options = self.project.network.options
@@ -1888,16 +1891,12 @@ class MainWindow(QMainWindow):
         options_dict['quality_type'] = options.quality_type.name
         
         dialog.load_data(options_dict)
-        
-        # Connect signal
-        dialog.options_updated.connect(self.update_analysis_options)
-        
         dialog.exec()
 
     def update_analysis_options(self, new_options: dict) -> None:
         """Update project analysis options."""
         from core.constants import FlowUnits, HeadLossType, QualityType
-        from core.units import UnitConverter
+        from core.units import get_converter
         
         options = self.project.network.options
         old_flow_units = options.flow_units
@@ -1918,8 +1917,8 @@ class MainWindow(QMainWindow):
         # Check for unit conversion
         new_flow_units = options.flow_units
         if old_flow_units != new_flow_units:
-            old_sys = UnitConverter(old_flow_units).system
-            new_sys = UnitConverter(new_flow_units).system
+            old_sys = get_converter(old_flow_units).system
+            new_sys = get_converter(new_flow_units).system
             
             if old_sys != new_sys:
                 reply = QMessageBox.question(
@@ -2122,8 +2121,8 @@ class MainWindow(QMainWindow):
         link_legend_values = list(self.map_widget.link_legend.values)
         
         # Initialize Unit Converter
-        from core.units import UnitConverter
-        converter = UnitConverter(self.project.network.options.flow_units)
+        from core.units import get_converter
+        converter = get_converter(self.project.network.options.flow_units)
         
         # Update Nodes
         if self.current_node_param:
@@ -2298,9 +2297,10 @@ class MainWindow(QMainWindow):
     
     def load_backdrop(self) -> None:
         """Load backdrop image."""
-        from gui.dialogs import BackdropDialog
-        
-        dialog = BackdropDialog(self.project, self)
+        dialog = self.backdrop_dialog
+        if dialog is None:
+            from gui.dialogs import BackdropDialog
+            dialog = self.backdrop_dialog = BackdropDialog(self.project, self)
         
         # Set default coordinates to current view extent
         # This ensures the backdrop is placed in the visible area
@@ -2407,24 +2407,6 @@ class MainWindow(QMainWindow):
         """Toggle backdrop visibility."""
         self.map_widget.scene.toggle_backdrop(checked)
 
-    # Help
-    
-    def show_about(self) -> None:
-        """Show about dialog."""
-        try:
-            version = self.project.get_version()
-        except:
-            version = "2.2.0"
-        
-        QMessageBox.about(
-            self,
-            "About EPANET",
-            f"<h3>EPANET {version}</h3>"
-            "<p>Water Distribution System Modeling Software</p>"
-            "<p>PySide6 GUI Implementation</p>"
-            "<p>© US Environmental Protection Agency</p>"
-        )
-    
     # Settings
     
     def restore_settings(self) -> None:
@@ -2454,18 +2436,18 @@ class MainWindow(QMainWindow):
             
         self.project.id_increment = int(self.settings.value("Defaults/IDIncrement", 1))
         
-        self.project.default_properties = {}
+        # Build the dict before assigning it: the setter caches parsed values
         self.settings.beginGroup("Defaults/Properties")
-        for key in self.settings.childKeys():
-            self.project.default_properties[key] = self.settings.value(key)
+        default_properties = {key: self.settings.value(key) for key in self.settings.childKeys()}
         self.settings.endGroup()
         
-        if not self.project.default_properties:
-            self.project.default_properties = {
+        if not default_properties:
+            default_properties = {
                 'node_elevation': '0', 'tank_diameter': '15', 'tank_height': '3',
                 'pipe_length': '100', 'auto_length': 'Off',
                 'pipe_diameter': '300', 'pipe_roughness': '100'
             }
+        self.project.default_properties = default_properties
     
     def save_settings(self) -> None:
         """Save window settings."""
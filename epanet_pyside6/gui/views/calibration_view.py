@@ -222,13 +222,17 @@ class CalibrationView(QWidget):
         simulated_values = []
         observed_values = []
         
+        # Bind the engine lookups once for the whole observation list
+        get_node_result = self.project.engine.get_node_result
+        get_link_result = self.project.engine.get_link_result
+        
         for data in self.observed_data:
             # Get simulated value
             sim_val = 0.0
             if data['type'] == 'Node':
-                sim_val = self.project.engine.get_node_result(data['id'], data['param'])
+                sim_val = get_node_result(data['id'], data['param'])
             else:
-                sim_val = self.project.engine.get_link_result(data['id'], data['param'])
+                sim_val = get_link_result(data['id'], data['param'])
                 
             data['simulated'] = sim_val
             simulated_values.append(sim_val)
@@ -2,6 +2,7 @@
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QComboBox, QLabel, QHBoxLayout, QPushButton, QFileDialog
 import pyqtgraph as pg
+import numpy as np
 import pandas as pd
 from core.constants import NodeParam, LinkParam
 from core.units import get_unit_label
@@ -176,11 +177,6 @@ class GraphView(QWidget):
             self.plot_widget.setTitle(f"No path between {start_node} and {end_node}")
             return
             
-        # Calculate distances and get values
-        distances = [0]
-        values = []
-        current_dist = 0
-        
         # Get current time step from project/engine if possible, otherwise use 0
         t_idx = 0 
         
@@ -205,29 +201,14 @@ class GraphView(QWidget):
         times = node_res[wntr_param].index
         t = times[t_idx]
         
-        # Collect data
-        x = []
-        y = []
+        # Values along the path
+        y = node_res[wntr_param].loc[t, path].tolist()
         
-        for i, node in enumerate(path):
-            # Value
-            val = node_res[wntr_param].loc[t, node]
-            y.append(val)
-            
-            # Distance
-            if i > 0:
-                prev_node = path[i-1]
-                # Find link between prev_node and node
-                # Let's just use coordinate distance if link length fails
-                dist = 0
-                n1 = self.project.network.nodes[prev_node]
-                n2 = self.project.network.nodes[node]
-                dx = n1.coordinates[0] - n2.coordinates[0]
-                dy = n1.coordinates[1] - n2.coordinates[1]
-                dist = (dx*dx + dy*dy)**0.5
-                current_dist += dist
-            
-            x.append(current_dist)
+        # Cumulative coordinate distance along the path
+        nodes = self.project.network.nodes
+        xs = np.array([nodes[n].x for n in path], dtype=float)
+        ys = np.array([nodes[n].y for n in path], dtype=float)
+        x = np.concatenate(([0.0], np.cumsum(np.hypot(np.diff(xs), np.diff(ys))))).tolist()
             
         unit_label = self._get_unit_label(param.name.lower())
         ylabel = f"{param.name} ({unit_label})" if unit_label else param.name
@@ -76,6 +76,82 @@ class SimpleControl:
             return None
         
         return None
+    
+    @staticmethod
+    def from_wntr(control, flow_units) -> Optional['SimpleControl']:
+        """Build from a WNTR control object without a text round trip.
+        
+        Values are converted from SI with WNTR's own INP unit factors for
+        flow_units, so they match what WNTR writes to [CONTROLS].
+        Returns None for rules and anything a simple control cannot express.
+        Relies on private WNTR control attributes (see the wntr pin in
+        requirements.txt); if those change this raises AttributeError
+        rather than silently dropping controls.
+        """
+        from wntr.network.base import LinkStatus
+        from wntr.network.controls import SimTimeCondition, TimeOfDayCondition, ValueCondition
+        from wntr.epanet.util import FlowUnits as WNTRFlowUnits, HydParam, from_si
+        
+        try:
+            units = WNTRFlowUnits[flow_units.name]
+            if control.epanet_control_type.name == 'rule':
+                return None
+            actions = control._then_actions
+            if len(actions) != 1 or control._else_actions:
+                return None
+            action = actions[0]
+            link = action._target_obj
+            if not hasattr(link, 'start_node_name'):
+                return None
+            
+            # Action -> status or setting
+            attribute = action._attribute.lower()
+            value = action._value
+            if attribute == 'status':
+                status = LinkStatus(value).name.upper()
+                if status not in ('OPEN', 'CLOSED', 'ACTIVE'):
+                    return None
+            elif attribute in ('setting', 'base_speed'):
+                valve_type = str(getattr(link, 'valve_type', '') or '').upper()
+                if attribute == 'setting' and valve_type in ('PRV', 'PSV', 'PBV'):
+                    value = from_si(units, value, HydParam.Pressure)
+                elif attribute == 'setting' and valve_type == 'FCV':
+                    value = from_si(units, value, HydParam.Flow)
+                status = f"{value:g}"
+            else:
+                return None
+            
+            condition = control._condition
+            if isinstance(condition, (SimTimeCondition, TimeOfDayCondition)):
+                control_type = "AT_CLOCKTIME" if isinstance(condition, TimeOfDayCondition) else "AT_TIME"
+                return SimpleControl(
+                    link_id=link.name,
+                    status=status,
+                    control_type=control_type,
+                    time=f"{condition._threshold / 3600.0:g}"
+                )
+            elif isinstance(condition, ValueCondition):
+                node = condition._source_obj
+                node_type = getattr(node, 'node_type', None)
+                if node_type == 'Tank':
+                    threshold = from_si(units, condition._threshold, HydParam.HydraulicHead)
+                elif node_type == 'Junction':
+                    threshold = from_si(units, condition._threshold, HydParam.Pressure)
+                else:
+                    return None
+                relation = condition._relation.name
+                return SimpleControl(
+                    link_id=link.name,
+                    status=status,
+                    control_type="IF_NODE",
+                    node_id=node.name,
+                    operator="BELOW" if relation in ('lt', 'le') else "ABOVE",
+                    value=threshold
+                )
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+        
+        return None
 
 
 @dataclass
@@ -5,7 +5,8 @@ from typing import Optional, List, Tuple
 from core.constants import LinkType, LinkStatus
 
 
-@dataclass
+# Slotted; subclasses call Link.__post_init__ explicitly (no bare super())
+@dataclass(slots=True)
 class Link:
     """Base class for network links."""
     id: str
@@ -24,6 +25,9 @@ class Link:
     status: LinkStatus = LinkStatus.OPEN
     setting: float = 0.0
     
+    # Scenario [STATUS] setting, None when not given
+    initial_setting: Optional[float] = None
+    
     def __post_init__(self):
         """Validate link data after initialization."""
         if not self.id:
@@ -41,7 +45,7 @@ class Link:
         self.vertices.reverse()
 
 
-@dataclass
+@dataclass(slots=True)
 class Pipe(Link):
     """Pipe link model."""
     length: float = 0.0
@@ -58,14 +62,14 @@ class Pipe(Link):
     has_check_valve: bool = False
     
     def __post_init__(self):
-        super().__post_init__()
+        Link.__post_init__(self)
         if self.has_check_valve:
             self.link_type = LinkType.CVPIPE
         else:
             self.link_type = LinkType.PIPE
 
 
-@dataclass
+@dataclass(slots=True)
 class Pump(Link):
     """Pump link model."""
     pump_curve: Optional[str] = None
@@ -83,11 +87,11 @@ class Pump(Link):
     energy_usage: float = 0.0
     
     def __post_init__(self):
-        super().__post_init__()
+        Link.__post_init__(self)
         self.link_type = LinkType.PUMP
 
 
-@dataclass
+@dataclass(slots=True)
 class Valve(Link):
     """Valve link model."""
     diameter: float = 0.0
@@ -95,9 +99,10 @@ class Valve(Link):
     valve_setting: float = 0.0
     minor_loss: float = 0.0
     initial_status: LinkStatus = LinkStatus.OPEN
+    fixed_status: LinkStatus = LinkStatus.OPEN
     
     def __post_init__(self):
-        super().__post_init__()
+        Link.__post_init__(self)
         # Validate valve type
         valid_types = [LinkType.PRV, LinkType.PSV, LinkType.PBV,
                       LinkType.FCV, LinkType.TCV, LinkType.GPV]
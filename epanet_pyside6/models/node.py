@@ -5,7 +5,8 @@ from typing import Optional, List, Dict
 from core.constants import NodeType, SourceType, MixingModel
 
 
-@dataclass
+# Slotted; subclasses call Node.__post_init__ explicitly (no bare super())
+@dataclass(slots=True)
 class Node:
     """Base class for network nodes."""
     id: str
@@ -28,7 +29,7 @@ class Node:
             raise ValueError("Node ID cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True)
 class Junction(Node):
     """Junction node model."""
     base_demand: float = 0.0
@@ -45,7 +46,7 @@ class Junction(Node):
     source_type: SourceType = SourceType.CONCEN
     
     def __post_init__(self):
-        super().__post_init__()
+        Node.__post_init__(self)
         self.node_type = NodeType.JUNCTION
     
     def add_demand(self, base_demand: float, pattern: str = "", name: str = ""):
@@ -64,7 +65,7 @@ class Junction(Node):
         return total
 
 
-@dataclass
+@dataclass(slots=True)
 class Reservoir(Node):
     """Reservoir node model."""
     total_head: float = 0.0
@@ -77,11 +78,11 @@ class Reservoir(Node):
     source_type: SourceType = SourceType.CONCEN
     
     def __post_init__(self):
-        super().__post_init__()
+        Node.__post_init__(self)
         self.node_type = NodeType.RESERVOIR
 
 
-@dataclass
+@dataclass(slots=True)
 class Tank(Node):
     """Tank node model."""
     init_level: float = 0.0
@@ -111,7 +112,7 @@ class Tank(Node):
     volume: float = 0.0
     
     def __post_init__(self):
-        super().__post_init__()
+        Node.__post_init__(self)
         self.node_type = NodeType.TANK
     
     def get_volume_at_level(self, level: float) -> float:
@@ -35,6 +35,31 @@ PRIORITY 1"""
         self.assertEqual(len(rule.else_actions), 1)
         self.assertEqual(rule.priority, 1.0)
         
+    def test_simple_control_from_wntr(self):
+        import wntr
+        from wntr.epanet.io import _read_control_line
+        from wntr.epanet.util import FlowUnits as WNTRFlowUnits
+        from core.constants import FlowUnits
+        
+        wn = wntr.network.WaterNetworkModel()
+        wn.add_reservoir("R1", base_head=100)
+        wn.add_junction("N1", elevation=10)
+        wn.add_pipe("P1", "R1", "N1")
+        
+        for text in ["LINK P1 CLOSED IF NODE N1 ABOVE 40", "LINK P1 OPEN AT TIME 6"]:
+            wntr_control = _read_control_line(text, wn, WNTRFlowUnits.GPM, "c")
+            control = SimpleControl.from_wntr(wntr_control, FlowUnits.GPM)
+            self.assertIsNotNone(control)
+            self.assertEqual(control.to_string(), text)
+
+        wn.add_junction("N2", elevation=10)
+        wn.add_valve("V1", "N1", "N2", valve_type="PRV")
+        text = "LINK V1 ACTIVE AT TIME 2"
+        wntr_control = _read_control_line(text, wn, WNTRFlowUnits.GPM, "c")
+        control = SimpleControl.from_wntr(wntr_control, FlowUnits.GPM)
+        self.assertIsNotNone(control)
+        self.assertEqual(control.to_string(), text)
+        
     def test_network_storage(self):
         network = Network()
         control = SimpleControl(link_id="P1", status="OPEN", control_type="AT_TIME", time="10:00")
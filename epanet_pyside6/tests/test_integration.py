@@ -90,5 +90,28 @@ class TestIntegration(unittest.TestCase):
         print(f"Old Pressure: {old_pressure}, New Pressure: {new_pressure}")
         self.assertGreater(new_pressure, old_pressure)
 
+    def test_report_reads_results_view(self):
+        """The report summarizes pressure from a zero-copy results view."""
+        import numpy as np
+        r1 = Reservoir("R1", 0, 0)
+        r1.total_head = 100.0
+        self.project.network.add_node(r1)
+        j1 = Junction("J1", 100, 0)
+        j1.elevation = 50.0
+        self.project.network.add_node(j1)
+        p1 = Pipe("P1", "R1", "J1")
+        p1.length = 1000.0
+        p1.diameter = 12.0
+        self.project.network.add_link(p1)
+        
+        self.project.run_simulation()
+        
+        view = self.project.get_results_view('pressure')
+        self.assertIsInstance(view, memoryview)
+        frame = self.project.engine.results.node['pressure']
+        self.assertTrue(np.shares_memory(np.asarray(view), frame.to_numpy(copy=False)))
+        self.assertIsNone(self.project.get_results_view('no_such_result'))
+        self.assertIn("Pressure Range:", self.project.last_report)
+
 if __name__ == '__main__':
     unittest.main()
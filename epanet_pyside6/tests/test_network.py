@@ -39,6 +39,21 @@ class TestNetwork(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.net.add_link(p2)
             
+    def test_add_bulk(self):
+        """Test adding nodes and links in one batch."""
+        self.net.add_nodes_bulk([Junction("J1", -5, 0), Junction("J2", 20000, 3)])
+        self.assertIn("J2", self.net.nodes)
+        self.assertEqual(self.net.map_bounds['min_x'], -5)
+        self.assertEqual(self.net.map_bounds['max_x'], 20000)
+        
+        self.net.add_links_bulk([Pipe("P1", "J1", "J2")])
+        self.assertIn("P1", self.net.links)
+        
+        # Nothing is added when any link is invalid
+        with self.assertRaises(ValueError):
+            self.net.add_links_bulk([Pipe("P2", "J1", "J2"), Pipe("P3", "J1", "MISSING")])
+        self.assertNotIn("P2", self.net.links)
+            
     def test_remove_node(self):
         """Test removing nodes."""
         j1 = Junction("J1", 0, 0)
@@ -63,5 +78,33 @@ class TestNetwork(unittest.TestCase):
         self.assertEqual(len(reservoirs), 1)
         self.assertEqual(reservoirs[0].id, "R1")
 
+    def test_type_index(self):
+        """Test per-type dicts follow add/remove/clear."""
+        self.net.add_nodes_bulk([Junction("J1", 0, 0), Reservoir("R1", 0, 0)])
+        self.net.add_link(Pipe("P1", "R1", "J1"))
+        self.assertEqual(list(self.net.junctions), ["J1"])
+        self.assertEqual(list(self.net.pipes), ["P1"])
+
+        self.assertTrue(self.net.remove_link("P1"))
+        self.assertFalse(self.net.remove_link("P1"))
+        self.net.remove_node("J1")
+        self.assertEqual(self.net.pipes, {})
+        self.assertEqual(self.net.junctions, {})
+
+        self.net.clear()
+        self.assertEqual(self.net.reservoirs, {})
+
+    def test_link_column(self):
+        """Test gathering a link attribute into an array."""
+        from models.link import Pump
+        self.net.add_node(Junction("J1", 0, 0))
+        self.net.add_node(Junction("J2", 10, 0))
+        self.net.add_link(Pipe("P1", "J1", "J2", length=120.0))
+        self.net.add_link(Pump("PU1", "J1", "J2"))
+        
+        lengths = self.net.link_column('length')
+        self.assertEqual(lengths[0], 120.0)
+        self.assertTrue(lengths[1] != lengths[1])  # NaN for pumps
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,115 @@
+"""Unit tests for syncing the project model to WNTR."""
+
+import unittest
+from core.project import EPANETProject
+from models.node import Junction, Reservoir
+from models.link import Pipe
+
+class TestProjectSync(unittest.TestCase):
+    """Test EPANETProject._sync_network_to_wntr."""
+
+    def setUp(self):
+        self.project = EPANETProject()
+        r1 = Reservoir("R1", 0, 0)
+        r1.total_head = 100.0
+        j1 = Junction("J1", 100, 0)
+        j1.elevation = 50.0
+        self.project.network.add_node(r1)
+        self.project.network.add_node(j1)
+        p1 = Pipe("P1", "R1", "J1")
+        p1.length = 1000.0
+        p1.diameter = 300.0
+        self.project.network.add_link(p1)
+        self.project._sync_network_to_wntr()
+
+    def test_unchanged_elements_skipped(self):
+        """Unchanged elements are not rewritten; edited ones are."""
+        wn = self.project.engine.wn
+        # Changed only on the WNTR side, so a resync must leave it alone
+        wn.get_node("R1").base_head = 1.0
+        self.project.network.get_node("J1").elevation = 60.0
+        self.project.network.get_link("P1").length = 500.0
+        self.project._sync_network_to_wntr()
+
+        self.assertEqual(wn.get_node("R1").base_head, 1.0)
+        self.assertAlmostEqual(wn.get_node("J1").elevation, 60.0)
+        self.assertAlmostEqual(wn.get_link("P1").length, 500.0)
+
+    def test_flow_units_change_resyncs(self):
+        """Changing flow units rewrites every element."""
+        from core.constants import FlowUnits
+        wn = self.project.engine.wn
+        wn.get_node("R1").base_head = 1.0
+        self.project.network.options.flow_units = FlowUnits.GPM
+        self.project._sync_network_to_wntr()
+
+        self.assertAlmostEqual(wn.get_node("R1").base_head, 100.0 / 3.28084)
+
+    def test_options_synced_when_changed(self):
+        """Options are only rewritten after they change."""
+        wn = self.project.engine.wn
+        wn.options.hydraulic.trials = 7
+        self.project._sync_network_to_wntr()
+        self.assertEqual(wn.options.hydraulic.trials, 7)
+
+        self.project.network.options.trials = 55
+        self.project._sync_network_to_wntr()
+        self.assertEqual(wn.options.hydraulic.trials, 55)
+
+    def test_patterns_synced_when_changed(self):
+        """Pattern multipliers are only rewritten after they change."""
+        from models import Pattern
+        wn = self.project.engine.wn
+        pattern = Pattern("PAT1", [1.0, 2.0])
+        self.project.network.patterns["PAT1"] = pattern
+        self.project._sync_network_to_wntr()
+
+        wn.get_pattern("PAT1").multipliers = [5.0]
+        self.project._sync_network_to_wntr()
+        self.assertEqual(list(wn.get_pattern("PAT1").multipliers), [5.0])
+
+        pattern.add_multiplier(3.0)
+        self.project._sync_network_to_wntr()
+        self.assertEqual(list(wn.get_pattern("PAT1").multipliers), [1.0, 2.0, 3.0])
+
+    def test_controls_reparsed_on_flow_units_change(self):
+        """Control thresholds follow a flow units change."""
+        from core.constants import FlowUnits
+        from models.control import SimpleControl
+        wn = self.project.engine.wn
+        self.project.network.options.flow_units = FlowUnits.GPM
+        control = SimpleControl.from_string("LINK P1 CLOSED IF NODE J1 ABOVE 10")
+        self.project.network.controls.append(control)
+        self.project._sync_network_to_wntr()
+        text = control.to_string()
+        us_threshold = wn.get_control(text)._condition._threshold
+        
+        self.project.network.options.flow_units = FlowUnits.LPS
+        self.project._sync_network_to_wntr()
+        si_threshold = wn.get_control(text)._condition._threshold
+        self.assertNotAlmostEqual(us_threshold, si_threshold)
+        self.assertAlmostEqual(si_threshold, 10.0)
+
+    def test_controls_reparsed_on_units_change_after_open(self):
+        """Opened controls follow a units change made before any sync."""
+        import os
+        import tempfile
+        from core.constants import FlowUnits
+        from models.control import SimpleControl
+        self.project.network.options.flow_units = FlowUnits.GPM
+        self.project.network.controls.append(
+            SimpleControl.from_string("LINK P1 CLOSED IF NODE J1 ABOVE 10"))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "controls.inp")
+            self.project.save_project(path)
+            project = EPANETProject()
+            project.open_project(path)
+            project.network.options.flow_units = FlowUnits.LPS
+            project.save_project(path)
+            with open(path) as f:
+                controls = f.read().split("[CONTROLS]", 1)[1].split("[", 1)[0]
+        self.assertIn("ABOVE 10", controls.upper())
+
+if __name__ == '__main__':
+    unittest.main()